@@ -0,0 +1,38 @@
+"""
+UserStore 查找性能测试：比较按 UUID 令牌线性扫描与 id 索引查找，
+运行方式：python benchmark_user_store.py
+"""
+import timeit
+from types import SimpleNamespace
+from uuid import uuid1
+
+from user_store import UserStore
+
+
+def build_store(size: int):
+    store = UserStore()
+    for i in range(size):
+        store.approve(SimpleNamespace(id=uuid1(), username=f"user{i}", password="pass", passphrase=b""))
+    return store
+
+
+def linear_scan(valid_users, id):
+    for key, val in valid_users.items():
+        if val.id == id:
+            return val
+    return None
+
+
+def run(sizes=(1_000, 10_000, 100_000), number=200):
+    print(f"{'users':>10} {'scan (us)':>12} {'index (us)':>12}")
+    for size in sizes:
+        store = build_store(size)
+        # 最坏情况：目标用户位于字典末尾
+        target = store.get_valid(f"user{size - 1}").id
+        scan = timeit.timeit(lambda: linear_scan(store.list_valid(), target), number=number)
+        index = timeit.timeit(lambda: store.get_valid_by_id(target), number=number)
+        print(f"{size:>10} {scan / number * 1e6:>12.2f} {index / number * 1e6:>12.2f}")
+
+
+if __name__ == '__main__':
+    run()
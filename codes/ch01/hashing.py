@@ -0,0 +1,86 @@
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from bcrypt import checkpw, hashpw, gensalt
+from fastapi import HTTPException, status
+
+HASH_WORKERS = int(os.getenv("CH01_HASH_WORKERS", "2"))
+HASH_MAX_PENDING = int(os.getenv("CH01_HASH_MAX_PENDING", "16"))
+
+
+class PasswordHasher:
+    """
+    bcrypt 专用线程池：哈希计算不再占用 Starlette 默认线程池，
+    排队任务超过上限时立即返回 503，并记录每次调用的排队和计算耗时
+    """
+
+    def __init__(self, workers: int = HASH_WORKERS, max_pending: int = HASH_MAX_PENDING):
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ch01-bcrypt")
+        self._slots = threading.BoundedSemaphore(workers + max_pending)
+        self._lock = threading.Lock()
+        self._workers = workers
+        self._max_pending = max_pending
+        self._in_flight = 0
+        self._calls = 0
+        self._rejected = 0
+        self._wait_ms = 0.0
+        self._run_ms = 0.0
+        self._max_run_ms = 0.0
+
+    async def hash(self, password: str) -> bytes:
+        return await self._submit(hashpw, password.encode(), gensalt())
+
+    async def check(self, password: str, passphrase) -> bool:
+        if isinstance(passphrase, str):
+            passphrase = passphrase.encode()
+        return await self._submit(checkpw, password.encode(), passphrase)
+
+    async def _submit(self, func, *args):
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self._rejected += 1
+            raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                                detail="password hashing is busy, try again later")
+        with self._lock:
+            self._in_flight += 1
+        queued_at = time.perf_counter()
+        try:
+            future = self._executor.submit(self._timed, func, queued_at, *args)
+            return await asyncio.wrap_future(future)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+            self._slots.release()
+
+    def _timed(self, func, queued_at: float, *args):
+        started_at = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            finished_at = time.perf_counter()
+            run_ms = (finished_at - started_at) * 1000
+            with self._lock:
+                self._calls += 1
+                self._wait_ms += (started_at - queued_at) * 1000
+                self._run_ms += run_ms
+                self._max_run_ms = max(self._max_run_ms, run_ms)
+
+    def metrics(self) -> dict:
+        with self._lock:
+            calls = self._calls
+            return {
+                "workers": self._workers,
+                "max_pending": self._max_pending,
+                "in_flight": self._in_flight,
+                "calls": calls,
+                "rejected": self._rejected,
+                "avg_wait_ms": self._wait_ms / calls if calls else 0.0,
+                "avg_run_ms": self._run_ms / calls if calls else 0.0,
+                "max_run_ms": self._max_run_ms,
+            }
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False)
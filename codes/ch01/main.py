@@ -15,16 +15,20 @@ from typing import Optional, List, Dict
 from uuid import UUID, uuid1
 
 import uvicorn
-from bcrypt import checkpw, hashpw, gensalt
-from fastapi import FastAPI, Form, Cookie, Response, Header
+from fastapi import FastAPI, Form, Cookie, Response, Header, Query
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
+from hashing import PasswordHasher
+from reply_index import ReplyIndex
+from user_store import UserStore
+
 app = FastAPI()
 
-valid_users = dict()
-valid_profiles = dict()
-pending_users = dict()
+users = UserStore()
+hasher = PasswordHasher()
 discussion_posts = dict()
+discussion_replies = dict()
 request_headers = dict()
 cookies = dict()
 
@@ -97,17 +101,17 @@ def index():
 def signup(uname: str, passwd: str):
     if uname is None and passwd is None:
         return {"message": "invalid user"}
-    elif not valid_users.get(uname) is None:
+    elif not users.get_valid(uname) is None:
         return {"message": "user exists"}
     else:
         user = User(username=uname, password=passwd)
-        pending_users[uname] = user
+        users.add_pending(uname, user)
         return user
 
 
 @app.post("/ch01/list/users/pending")
 def list_pending_users():
-    return pending_users
+    return users.list_pending()
 
 
 @app.delete("/ch01/delete/users/pending")
@@ -115,26 +119,25 @@ def delete_pending_users(accounts=None):
     if accounts is None:
         accounts = []
     for user in accounts:
-        del pending_users[user]
+        users.remove_pending(user)
     return {"message": "deleted pending users"}
 
 
 @app.post("/ch01/login/validate", response_model=ValidUser)
-def approve_user(user: User):
-    if not valid_users.get(user.username) is None:
+async def approve_user(user: User):
+    if not users.get_valid(user.username) is None:
         return ValidUser(id=None, username=None, password=None, passphrase=None)
     else:
         valid_user = ValidUser(id=uuid1(), username=user.username, password=user.password,
-                               passphrase=hashpw(user.password.encode(), gensalt()))
-        valid_users[user.username] = valid_user
-        del pending_users[user.username]
+                               passphrase=await hasher.hash(user.password))
+        users.approve(valid_user)
         return valid_user
 
 
 @app.delete("/ch01/login/remove/all")
 def delete_users(usernames: List[str]):
     for user in usernames:
-        del valid_users[user]
+        users.remove_valid(user)
     return {"message": "deleted users"}
 
 
@@ -143,22 +146,27 @@ def delete_user(username: str):
     if username is None:
         return {"message": "invalid user"}
     else:
-        del valid_users[username]
+        users.remove_valid(username)
         return {"message": "deleted user"}
 
 
 @app.get("/ch01/list/users/valid")
 def list_valid_users():
-    return valid_users
+    return users.list_valid()
+
+
+@app.get("/ch01/list/users/type/{user_type}")
+def list_users_by_type(user_type: UserType):
+    return sorted(users.usernames_by_type(user_type))
 
 
 @app.get("/ch01/login/", description="登录服务")
-def login(username: str, password: str):
-    if valid_users.get(username) is None:
+async def login(username: str, password: str):
+    user = users.get_valid(username)
+    if user is None:
         return {"message": "user does not exist"}
     else:
-        user = valid_users.get(username)
-        if checkpw(password.encode(), user.passphrase.encode()):
+        if await hasher.check(password, user.passphrase):
             return user
         else:
             return {"message": "invalid user"}
@@ -172,23 +180,18 @@ def login_info():
 
 # should be above /ch01/login/{username}/{password}
 @app.get("/ch01/login/password/change")
-def change_password(username: str, old_passw: str = '', new_passw: str = ''):
+async def change_password(username: str, old_passw: str = '', new_passw: str = ''):
     passwd_len = 8
-    if valid_users.get(username) is None:
+    if users.get_valid(username) is None:
         return {"message": "user does not exist"}
     elif old_passw == '' or new_passw == '':
         characters = ascii_lowercase
         temporary_passwd = ''.join(random.choice(characters) for _ in range(passwd_len))
-        user = valid_users.get(username)
-        user.password = temporary_passwd
-        user.passphrase = hashpw(temporary_passwd.encode(), gensalt())
-        return user
+        return users.change_password(username, temporary_passwd, await hasher.hash(temporary_passwd))
     else:
-        user = valid_users.get(username)
+        user = users.get_valid(username)
         if user.password == old_passw:
-            user.password = new_passw
-            user.passphrase = hashpw(new_passw.encode(), gensalt())
-            return user
+            return users.change_password(username, new_passw, await hasher.hash(new_passw))
         else:
             return {"message": "invalid user"}
 
@@ -199,10 +202,10 @@ def unlock_username(id: Optional[UUID] = None):
     if id is None:
         return {"message": "token needed"}
     else:
-        for key, val in valid_users.items():
-            if val.id == id:
-                return {"username": val.username}
-        return {"message": "user does not exist"}
+        user = users.get_valid_by_id(id)
+        if user is None:
+            return {"message": "user does not exist"}
+        return {"username": user.username}
 
 
 # should be above /ch01/login/{username}/{password}
@@ -210,13 +213,13 @@ def unlock_username(id: Optional[UUID] = None):
 def unlock_password(username: Optional[str] = None, id: Optional[UUID] = None):
     if username is None:
         return {"message": "username is required"}
-    elif valid_users.get(username) is None:
+    elif users.get_valid(username) is None:
         return {"message": "user does not exist"}
     else:
         if id is None:
             return {"message": "token needed"}
         else:
-            user = valid_users.get(username)
+            user = users.get_valid(username)
             if user.id == id:
                 return {"password": user.password}
             else:
@@ -224,12 +227,12 @@ def unlock_password(username: Optional[str] = None, id: Optional[UUID] = None):
 
 
 @app.get("/ch01/login/{username}/{password}")
-def login_with_token(username: str, password: str, id: UUID):
-    if valid_users.get(username) is None:
+async def login_with_token(username: str, password: str, id: UUID):
+    if users.get_valid(username) is None:
         return {"message": "user does not exist"}
     else:
-        user = valid_users[username]
-        if user.id == id and checkpw(password.encode(), user.passphrase):
+        user = users.get_valid(username)
+        if user.id == id and await hasher.check(password, user.passphrase):
             return user
         else:
             return {"message": "invalid user"}
@@ -244,24 +247,24 @@ def add_profile(uname: str,
                 sal: float = Form(...),
                 bday: str = Form(...),
                 utype: UserType = Form(...)):
-    if valid_users.get(uname) is None:
+    if users.get_valid(uname) is None:
         return UserProfile(firstname=None, lastname=None, middle_initial=None, age=None, birthday=None, salary=None,
                            user_type=None)
     else:
         profile = UserProfile(firstname=fname, lastname=lname, middle_initial=mid_init, age=user_age,
                               birthday=datetime.strptime(bday, '%m/%d/%Y'), salary=sal, user_type=utype)
-        valid_profiles[uname] = profile
+        users.set_profile(uname, profile)
         return profile
 
 
 @app.put("/ch01/account/profile/update/{username}", description="个人资料管理更新服务")
 def update_profile(username: str, id: UUID, new_profile: UserProfile):
-    if valid_users.get(username) is None:
+    if users.get_valid(username) is None:
         return {"message": "user does not exist"}
     else:
-        user = valid_users.get(username)
+        user = users.get_valid(username)
         if user.id == id:
-            valid_profiles[username] = new_profile
+            users.set_profile(username, new_profile)
             return {"message": "successfully updated"}
         else:
             return {"message": "user does not exist"}
@@ -269,18 +272,17 @@ def update_profile(username: str, id: UUID, new_profile: UserProfile):
 
 @app.patch("/ch01/account/profile/update/names/{username}", description="个人资料管理更新服务")
 def update_profile_names(id: UUID, username: str = '', new_names: Optional[Dict[str, str]] = None):
-    if valid_users.get(username) is None:
+    if users.get_valid(username) is None:
         return {"message": "user does not exist"}
     elif new_names is None:
         return {"message": "new names are required"}
     else:
-        user = valid_users.get(username)
+        user = users.get_valid(username)
         if user.id == id:
-            profile = valid_profiles[username]
+            profile = users.get_profile(username)
             profile.firstname = new_names['fname']
             profile.lastname = new_names['lname']
             profile.middle_initial = new_names['mi']
-            valid_profiles[username] = profile
             return {"message": "successfully updated"}
         else:
             return {"message": "user does not exist"}
@@ -288,48 +290,48 @@ def update_profile_names(id: UUID, username: str = '', new_names: Optional[Dict[
 
 @app.get("/ch01/account/profile/view/{username}")
 def access_profile(username: str, id: UUID):
-    if valid_users.get(username) is None:
+    if users.get_valid(username) is None:
         return {"message": "user does not exist"}
     else:
-        user = valid_users.get(username)
+        user = users.get_valid(username)
         if user.id == id:
-            return valid_profiles[username]
+            return users.get_profile(username)
         else:
             return {"message": "user does not exist"}
 
 
 @app.post("/ch01/discussion/posts/add/{username}")
 def post_discussion(username: str, post: Post, post_type: PostType):
-    if valid_users.get(username) is None:
+    if users.get_valid(username) is None:
         return {"message": "user does not exist"}
     elif not (discussion_posts.get(id) is None):
         return {"message": "post already exists"}
     else:
         forum_post = ForumPost(id=uuid1(), topic=post.topic, message=post.message, post_type=post_type,
                                date_posted=post.date_posted, username=username)
-        user = valid_profiles[username]
+        user = users.get_profile(username)
         forum = ForumDiscussion(id=uuid1(), main_post=forum_post, author=user, replies=list())
         discussion_posts[forum.id] = forum
+        discussion_replies[forum.id] = ReplyIndex()
         return forum
 
 
 @app.post("/ch01/discussion/posts/reply/{username}")
 def post_reply(username: str, id: UUID, post_type: PostType, post_reply: Post):
-    if valid_users.get(username) is None:
+    if users.get_valid(username) is None:
         return {"message": "user does not exist"}
     elif discussion_posts.get(id) is None:
         return {"message": "post does not exist"}
     else:
         reply = ForumPost(id=uuid1(), topic=post_reply.topic, message=post_reply.message, post_type=post_type,
                           date_posted=post_reply.date_posted, username=username)
-        main_post = discussion_posts[id]
-        main_post.replies.append(reply)
+        discussion_replies[id].append(reply)
         return reply
 
 
 @app.put("/ch01/discussion/posts/update/{username}")
 def update_discussion(username: str, id: UUID, post_type: PostType, post: Post):
-    if valid_users.get(username) is None:
+    if users.get_valid(username) is None:
         return {"message": "user does not exist"}
     elif discussion_posts.get(id) is None:
         return {"message": "post does not exist"}
@@ -343,24 +345,53 @@ def update_discussion(username: str, id: UUID, post_type: PostType, post: Post):
 
 @app.delete("/ch01/discussion/posts/remove/{username}", description="删除评论服务")
 def delete_discussion(username: str, id: UUID):
-    if valid_users.get(username) is None:
+    if users.get_valid(username) is None:
         return {"message": "user does not exist"}
     elif discussion_posts.get(id) is None:
         return {"message": "post does not exist"}
     else:
         del discussion_posts[id]
+        del discussion_replies[id]
         return {"message": "main post deleted"}
 
 
 @app.get("/ch01/discussion/posts/view/{username}")
-def view_discussion(username: str, id: UUID):
-    if valid_users.get(username) is None:
+def view_discussion(resp: Response, username: str, id: UUID, after: Optional[UUID] = None,
+                    limit: int = Query(50, ge=1, le=500)):
+    if users.get_valid(username) is None:
         return {"message": "user does not exist"}
     elif discussion_posts.get(id) is None:
         return {"message": "post does not exist"}
     else:
+        try:
+            replies, next_after = discussion_replies[id].page(after, limit)
+        except KeyError:
+            return {"message": "reply does not exist"}
+        if next_after is not None:
+            resp.headers["X-Next-After"] = str(next_after)
         forum = discussion_posts[id]
-        return forum
+        return forum.model_copy(update={"replies": replies})
+
+
+@app.get("/ch01/discussion/posts/stream/{username}", description="以NDJSON格式流式返回讨论回复")
+def stream_discussion(username: str, id: UUID, after: Optional[UUID] = None):
+    if users.get_valid(username) is None:
+        return {"message": "user does not exist"}
+    elif discussion_posts.get(id) is None:
+        return {"message": "post does not exist"}
+    else:
+        try:
+            replies = discussion_replies[id].iter_from(after)
+        except KeyError:
+            return {"message": "reply does not exist"}
+        forum = discussion_posts[id]
+
+        def encode_thread():
+            yield forum.model_dump_json(exclude={"replies"}) + "\n"
+            for reply in replies:
+                yield reply.model_dump_json() + "\n"
+
+        return StreamingResponse(encode_thread(), media_type="application/x-ndjson")
 
 
 @app.get("/ch01/headers/verify")
@@ -391,5 +422,15 @@ def create_cookies(resp: Response, id: UUID, username: str = ''):
     return {"message": "remember-me tokens created"}
 
 
+@app.get("/ch01/metrics/hashing", description="密码哈希线程池指标")
+def hashing_metrics():
+    return hasher.metrics()
+
+
+@app.on_event("shutdown")
+def shutdown_hasher():
+    hasher.shutdown()
+
+
 if __name__ == '__main__':
     uvicorn.run(app='main:app', reload=True)
@@ -0,0 +1,40 @@
+from typing import Dict, Iterator, List, Optional, Tuple
+from uuid import UUID
+
+
+class ReplyIndex:
+    """
+    单个讨论帖的回复索引：回复只追加不修改，并记录 reply_id -> 位置，
+    以便按游标（after=<reply_id>）定位分页起点
+    """
+
+    def __init__(self):
+        self._replies: List[object] = list()
+        self._positions: Dict[UUID, int] = dict()
+
+    def append(self, reply) -> None:
+        self._positions[reply.id] = len(self._replies)
+        self._replies.append(reply)
+
+    def start_of(self, after: Optional[UUID] = None) -> int:
+        if after is None:
+            return 0
+        # 游标不存在时抛出 KeyError，由调用方转换为错误消息
+        return self._positions[after] + 1
+
+    def page(self, after: Optional[UUID] = None, limit: int = 50) -> Tuple[List[object], Optional[UUID]]:
+        start = self.start_of(after)
+        replies = self._replies[start:start + limit]
+        if start + limit < len(self._replies):
+            return replies, replies[-1].id
+        return replies, None
+
+    def iter_from(self, after: Optional[UUID] = None) -> Iterator[object]:
+        # 先定位游标，使无效游标在开始流式输出前就抛出 KeyError
+        start = self.start_of(after)
+        # 只迭代到开始时的长度，流式输出期间新追加的回复留给下一次请求
+        end = len(self._replies)
+        return (self._replies[pos] for pos in range(start, end))
+
+    def __len__(self):
+        return len(self._replies)
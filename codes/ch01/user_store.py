@@ -0,0 +1,82 @@
+from collections import defaultdict
+from typing import Dict, Optional, Set
+from uuid import UUID
+
+
+class UserStore:
+    """
+    内存用户存储：维护待审核用户、有效用户和个人资料，
+    并保持 id->username、user_type->usernames 两个二级索引与主表一致
+    """
+
+    def __init__(self):
+        self._pending: Dict[str, object] = dict()
+        self._valid: Dict[str, object] = dict()
+        self._profiles: Dict[str, object] = dict()
+        self._ids: Dict[UUID, str] = dict()
+        self._types: Dict[str, Set[str]] = defaultdict(set)
+
+    # pending users
+    def add_pending(self, username: str, user) -> None:
+        self._pending[username] = user
+
+    def remove_pending(self, username: str) -> None:
+        del self._pending[username]
+
+    def list_pending(self) -> Dict[str, object]:
+        return self._pending
+
+    # valid users
+    def approve(self, valid_user) -> None:
+        self._valid[valid_user.username] = valid_user
+        self._ids[valid_user.id] = valid_user.username
+        self._pending.pop(valid_user.username, None)
+
+    def get_valid(self, username: Optional[str]):
+        return self._valid.get(username)
+
+    def get_valid_by_id(self, id: UUID):
+        username = self._ids.get(id)
+        if username is None:
+            return None
+        return self._valid.get(username)
+
+    def change_password(self, username: str, password: str, passphrase) -> object:
+        user = self._valid[username]
+        user.password = password
+        user.passphrase = passphrase
+        return user
+
+    def remove_valid(self, username: str) -> None:
+        user = self._valid.pop(username)
+        self._ids.pop(user.id, None)
+        profile = self._profiles.pop(username, None)
+        if profile is not None:
+            self._unindex_type(username, profile.user_type)
+
+    def list_valid(self) -> Dict[str, object]:
+        return self._valid
+
+    # profiles
+    def set_profile(self, username: str, profile) -> None:
+        old_profile = self._profiles.get(username)
+        if old_profile is not None:
+            self._unindex_type(username, old_profile.user_type)
+        self._profiles[username] = profile
+        self._types[profile.user_type].add(username)
+
+    def get_profile(self, username: str):
+        return self._profiles.get(username)
+
+    def usernames_by_type(self, user_type: str) -> Set[str]:
+        return self._types.get(user_type, set())
+
+    def _unindex_type(self, username: str, user_type: str) -> None:
+        usernames = self._types.get(user_type)
+        if usernames is not None:
+            usernames.discard(username)
+            if not usernames:
+                del self._types[user_type]
+
+    def __len__(self):
+        return len(self._valid)
@@ -1,11 +1,15 @@
 from uuid import UUID, uuid1
 
-from fastapi import APIRouter, status
+from typing import Optional
+
+from fastapi import APIRouter, Query, status
 from fastapi.encoders import jsonable_encoder
 from fastapi.responses import JSONResponse
 
-from login.user import pending_users, approved_users
-from places.destination import Tour, TourBasicInfo, TourInput, TourLocation, tours, tours_basic_info, tours_locations
+from background import audit_trail
+from login.user import pending_users, approved_users, visitor_ranking, tourists_by_username
+from places.destination import Tour, TourBasicInfo, TourInput, TourLocation, tours, tours_basic_info, tours_locations, \
+    tour_ranking, tour_geo_index, tours_catalog, tours_by_availability
 
 router = APIRouter()
 
@@ -24,6 +28,10 @@ def add_tour_destination(input: TourInput):
         tours[tid] = tour
         tours_basic_info[tid] = tour_basic_info
         tours_locations[tid] = tour_location
+        tour_ranking.update(tid, tour.ratings)
+        tour_geo_index.upsert(tid, input.location.latitude, input.location.longitude)
+        tours_by_availability.add(tour.isBooked, tid)
+        tours_catalog.invalidate()
         tour_json = jsonable_encoder(tour)
         return JSONResponse(content=tour_json, status_code=status.HTTP_201_CREATED)
     except:
@@ -33,9 +41,13 @@ def add_tour_destination(input: TourInput):
 @router.delete("/ch02/admin/destination/remove/{id}")
 def remove_tour_destination(id: UUID):
     try:
+        tours_by_availability.remove(tours[id].isBooked, id)
         del tours[id]
         del tours_basic_info[id]
         del tours_locations[id]
+        tour_ranking.remove(id)
+        tour_geo_index.remove(id)
+        tours_catalog.invalidate()
         return JSONResponse(content={"message": "tour deleted"}, status_code=status.HTTP_202_ACCEPTED)
     except:
         return JSONResponse(content={"message": "tour does not exist"},
@@ -46,13 +58,20 @@ def remove_tour_destination(id: UUID):
 def update_tour_destination(tour: Tour):
     try:
         tid = tour.id
+        old_tour = tours.get(tid)
         tours[tid] = tour
+        if old_tour is not None:
+            tours_by_availability.remove(old_tour.isBooked, tid)
+        tours_by_availability.add(tour.isBooked, tid)
         tour_basic_info = TourBasicInfo(id=tid, name=tour.name, type=tour.type, amenities=tour.amenities,
                                         ratings=tour.ratings)
         tour_location = TourLocation(id=tid, name=tour.name, city=tour.city, country=tour.country,
                                      location=tour.location)
         tours_basic_info[tid] = tour_basic_info
         tours_locations[tid] = tour_location
+        tour_ranking.update(tid, tour.ratings)
+        tour_geo_index.upsert(tid, tour.location.latitude, tour.location.longitude)
+        tours_catalog.invalidate()
         return {"message": "tour updated"}
     except:
         return {"message": "tour does not exist"}
@@ -74,9 +93,9 @@ def list_all_pending():
 
 
 @router.get("/ch02/admin/tourists/vip")
-def list_valuable_visitors():
+def list_valuable_visitors(limit: Optional[int] = Query(None, ge=1)):
     try:
-        sort_orders = sorted(approved_users.items(), key=lambda x: x[1].booked, reverse=True)
+        sort_orders = [(uid, approved_users[uid]) for uid in visitor_ranking.top(limit)]
         sorted_orders_json = jsonable_encoder(sort_orders)
         return JSONResponse(content=sorted_orders_json, status_code=status.HTTP_200_OK)
     except:
@@ -88,6 +107,14 @@ def approve_login(userid: UUID):
     try:
         approved_users[userid] = pending_users[userid]
         del pending_users[userid]
+        visitor_ranking.update(userid, approved_users[userid]['booked'])
+        tourists_by_username.add(approved_users[userid]['login']['username'], userid)
         return JSONResponse(content={"message": "user approved"}, status_code=status.HTTP_200_OK)
     except:
         return JSONResponse(content={"message": "invalid operation"}, status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+@router.get("/ch02/admin/audit/list")
+def list_audit_events(touristId: UUID, limit: int = Query(100, ge=1)):
+    events = audit_trail.query(str(touristId), limit)
+    return JSONResponse(content=events, status_code=status.HTTP_200_OK)
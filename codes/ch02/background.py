@@ -1,7 +1,140 @@
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import defaultdict
 from datetime import datetime
+from typing import Dict, List, Optional
+
+# 审计日志默认写在临时目录下，不在源码目录中生成文件，可用 CH02_AUDIT_DIR 指定
+AUDIT_DIR = os.getenv("CH02_AUDIT_DIR", os.path.join(tempfile.gettempdir(), "ch02-audit"))
+
+
+class AuditTrail:
+    """
+    审计日志：单个长期打开的 JSONL 写入器，按记录数或时间间隔批量 fsync，
+    并维护 touristId -> 文件偏移量的旁路索引（.idx），按游客查询时只读取命中的记录
+    """
+
+    def __init__(self, path: str = os.path.join(AUDIT_DIR, "audit_log.jsonl"), fsync_every: int = 50, fsync_interval: float = 1.0):
+        self.path = path
+        self.index_path = f"{path}.idx"
+        self.fsync_every = fsync_every
+        self.fsync_interval = fsync_interval
+        self._lock = threading.Lock()
+        self._file = None
+        self._index_file = None
+        self._offsets: Dict[str, List[int]] = defaultdict(list)
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+        self._closed = threading.Event()
+        self._syncer: Optional[threading.Thread] = None
+
+    def record(self, touristId: str, message: str = "") -> None:
+        entry = {"touristId": touristId, "message": message, "timestamp": datetime.now().isoformat()}
+        line = (json.dumps(entry) + "\n").encode()
+        with self._lock:
+            self._open()
+            offset = self._file.tell()
+            self._file.write(line)
+            self._index_file.write(f"{touristId}\t{offset}\n".encode())
+            self._offsets[touristId].append(offset)
+            self._unsynced += 1
+            if self._unsynced >= self.fsync_every or time.monotonic() - self._last_sync >= self.fsync_interval:
+                self._sync()
+
+    def query(self, touristId: str, limit: Optional[int] = None) -> List[dict]:
+        with self._lock:
+            self._open()
+            offsets = list(self._offsets.get(touristId, []))
+            self._file.flush()
+        if limit is not None:
+            offsets = offsets[-limit:]
+        events = list()
+        with open(self.path, mode="rb") as logfile:
+            for offset in offsets:
+                logfile.seek(offset)
+                events.append(json.loads(logfile.readline()))
+        return events
+
+    def close(self) -> None:
+        self._closed.set()
+        if self._syncer is not None:
+            self._syncer.join()
+            self._syncer = None
+        with self._lock:
+            if self._file is not None:
+                self._sync()
+                self._file.close()
+                self._index_file.close()
+                self._file = None
+                self._index_file = None
+
+    def _sync_periodically(self) -> None:
+        # 写入停止后 fsync_interval 仍然生效，不依赖下一次 record 触发
+        while not self._closed.wait(self.fsync_interval):
+            with self._lock:
+                if self._file is not None and self._unsynced:
+                    self._sync()
+
+    def _sync(self) -> None:
+        for f in (self._file, self._index_file):
+            f.flush()
+            os.fsync(f.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def _open(self) -> None:
+        if self._file is not None:
+            return
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self._load_index()
+        self._file = open(self.path, mode="ab")
+        self._index_file = open(self.index_path, mode="ab")
+        if self._syncer is None:
+            self._closed.clear()
+            self._syncer = threading.Thread(target=self._sync_periodically, daemon=True)
+            self._syncer.start()
+
+    def _load_index(self) -> None:
+        self._offsets.clear()
+        last_offset = -1
+        if os.path.exists(self.index_path):
+            valid_size = 0
+            with open(self.index_path, mode="rb") as index_file:
+                for row in index_file:
+                    if not row.endswith(b"\n"):
+                        break
+                    touristId, offset = row.decode().rstrip("\n").split("\t")
+                    self._offsets[touristId].append(int(offset))
+                    last_offset = max(last_offset, int(offset))
+                    valid_size += len(row)
+            if valid_size < os.path.getsize(self.index_path):
+                # 丢弃索引末尾写了一半的行，缺失的记录由下面从日志补齐
+                os.truncate(self.index_path, valid_size)
+        if not os.path.exists(self.path):
+            return
+        # 补齐上次异常退出时已写入日志但未写入索引的记录
+        with open(self.path, mode="rb") as logfile, open(self.index_path, mode="ab") as index_file:
+            if last_offset >= 0:
+                logfile.seek(last_offset)
+                logfile.readline()
+            while True:
+                offset = logfile.tell()
+                line = logfile.readline()
+                if not line.endswith(b"\n"):
+                    break
+                touristId = json.loads(line)["touristId"]
+                index_file.write(f"{touristId}\t{offset}\n".encode())
+                self._offsets[touristId].append(offset)
+        if line:
+            # 丢弃末尾写了一半的记录
+            os.truncate(self.path, offset)
+
+
+audit_trail = AuditTrail()
 
 
 def audit_log_transaction(touristId: str, message=""):
-    with open("audit_log.txt", mode="a") as logfile:
-        content = f"tourist {touristId} executed {message} at {datetime.now()}\t\n"
-        logfile.write(content)
+    audit_trail.record(touristId, message)
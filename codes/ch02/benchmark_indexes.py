@@ -0,0 +1,61 @@
+"""
+二级索引性能测试：比较全表扫描与 SecondaryIndex 查询，
+覆盖按用户名登录、按游客查询评论、查询可预订线路三个场景，
+运行方式：python benchmark_indexes.py
+"""
+import timeit
+from types import SimpleNamespace
+from uuid import uuid1
+
+from indexes import SecondaryIndex
+
+
+def build_tables(size: int):
+    approved_users, tourists_by_username = dict(), SecondaryIndex()
+    feedback_tour, assessments_by_tourist = dict(), SecondaryIndex()
+    tours, tours_by_availability = dict(), SecondaryIndex()
+    tourist_ids = list()
+    for i in range(size):
+        tid = uuid1()
+        tourist_ids.append(tid)
+        approved_users[tid] = {"login": {"id": str(tid), "username": f"user{i}", "password": "pass"}}
+        tourists_by_username.add(f"user{i}", tid)
+    for i in range(size):
+        aid, tourist_id = uuid1(), tourist_ids[i % 1000]
+        feedback_tour[aid] = SimpleNamespace(id=aid, tourist_id=tourist_id)
+        assessments_by_tourist.add(tourist_id, aid)
+    for i in range(size):
+        tid = uuid1()
+        # 只有 10 条线路可预订
+        tours[tid] = SimpleNamespace(id=tid, isBooked=i >= 10)
+        tours_by_availability.add(tours[tid].isBooked, tid)
+    return {
+        "login": (
+            lambda: [t for t in approved_users.values()
+                     if t['login']['username'] == "user7" and t['login']['password'] == "pass"],
+            lambda: [approved_users[tid] for tid in tourists_by_username.get("user7")
+                     if approved_users[tid]['login']['password'] == "pass"],
+        ),
+        "feedback": (
+            lambda: [a for a in feedback_tour.values() if a.tourist_id == tourist_ids[7]],
+            lambda: [feedback_tour[aid] for aid in assessments_by_tourist.get(tourist_ids[7])],
+        ),
+        "available": (
+            lambda: [t for t in tours.values() if t.isBooked is False],
+            lambda: [tours[tid] for tid in tours_by_availability.get(False)],
+        ),
+    }
+
+
+def run(sizes=(1_000, 10_000, 100_000), number=50):
+    print(f"{'rows':>8} {'endpoint':>10} {'scan (us)':>12} {'index (us)':>12}")
+    for size in sizes:
+        for name, (scan, index) in build_tables(size).items():
+            assert len(scan()) == len(index())
+            scan_us = timeit.timeit(scan, number=number) / number * 1e6
+            index_us = timeit.timeit(index, number=number) / number * 1e6
+            print(f"{size:>8} {name:>10} {scan_us:>12.2f} {index_us:>12.2f}")
+
+
+if __name__ == '__main__':
+    run()
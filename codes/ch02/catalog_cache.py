@@ -0,0 +1,39 @@
+import json
+import threading
+from typing import Callable, Optional, Tuple
+from uuid import uuid4
+
+from fastapi.encoders import jsonable_encoder
+
+
+class CatalogCache:
+    """
+    预序列化的目录缓存：保存编码后的 JSON 字节和单调递增的版本号，
+    写操作调用 invalidate() 递增版本，读操作在版本未变化时直接复用字节并返回 ETag
+    """
+
+    def __init__(self, build: Callable[[], object]):
+        self._build = build
+        self._lock = threading.Lock()
+        # 进程标识防止重启后版本号从头计数时与客户端缓存的旧 ETag 冲突
+        self._boot_id = uuid4().hex[:8]
+        self._version = 0
+        self._cached_version: Optional[int] = None
+        self._body = b""
+
+    @property
+    def etag(self) -> str:
+        return f'"{self._boot_id}-{self._version}"'
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._version += 1
+
+    def get(self) -> Tuple[bytes, str]:
+        with self._lock:
+            if self._cached_version != self._version:
+                content = jsonable_encoder(self._build())
+                self._body = json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None,
+                                        separators=(",", ":")).encode("utf-8")
+                self._cached_version = self._version
+            return self._body, self.etag
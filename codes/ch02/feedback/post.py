@@ -6,14 +6,18 @@ from fastapi.responses import JSONResponse
 from uuid import UUID, uuid1
 from handler_exceptions import PostRatingException, PostFeedbackException
 
-from places.destination import tours, StarRating, Post
+from places.destination import tours, tour_ranking, tours_catalog, StarRating, Post
 from login.user import approved_users
 from background import audit_log_transaction
 from utility import check_post_owner
+from indexes import SecondaryIndex
+from rating_stats import RatingAggregate
 
 router = APIRouter()
 
 feedback_tour = dict()
+assessments_by_tourist = SecondaryIndex()
+tour_rating_stats = dict()
 
 
 class Assessment(BaseModel):
@@ -23,6 +27,13 @@ class Assessment(BaseModel):
     tourist_id: UUID
 
 
+def refresh_tour_rating(tid: UUID):
+    if tours.get(tid) is not None:
+        tours[tid].ratings = tour_rating_stats[tid].mean
+        tour_ranking.update(tid, tours[tid].ratings)
+        tours_catalog.invalidate()
+
+
 @router.post("/feedback/add")
 def post_tourist_feedback(touristId: UUID, tid: UUID, post: Post, bg_task: BackgroundTasks):
     if approved_users.get(touristId) is None and tours.get(tid) is None:
@@ -30,7 +41,9 @@ def post_tourist_feedback(touristId: UUID, tid: UUID, post: Post, bg_task: Backg
     assessId = uuid1()
     assessment = Assessment(id=assessId, post=post, tour_id=tid, tourist_id=touristId)
     feedback_tour[assessId] = assessment
-    tours[tid].ratings = (tours[tid].ratings + post.rating) / 2
+    assessments_by_tourist.add(touristId, assessId)
+    tour_rating_stats.setdefault(tid, RatingAggregate()).add(post.rating)
+    refresh_tour_rating(tid)
 
     assess_json = jsonable_encoder(assessment)
     # 埋点：添加评论
@@ -40,11 +53,13 @@ def post_tourist_feedback(touristId: UUID, tid: UUID, post: Post, bg_task: Backg
 
 @router.post("/feedback/update/rating")
 def update_tour_rating(assessId: UUID, new_rating: StarRating):
-    print(new_rating)
     if feedback_tour.get(assessId) is None:
         raise PostRatingException(detail='tour assessment invalid', status_code=403)
-    tid = feedback_tour[assessId].tour_id
-    tours[tid].ratings = (tours[tid].ratings + new_rating) / 2
+    assessment = feedback_tour[assessId]
+    tid = assessment.tour_id
+    tour_rating_stats[tid].replace(assessment.post.rating, new_rating)
+    assessment.post.rating = new_rating
+    refresh_tour_rating(tid)
     tour_json = jsonable_encoder(tours[tid])
     return JSONResponse(content=tour_json, status_code=200)
 
@@ -53,17 +68,25 @@ def update_tour_rating(assessId: UUID, new_rating: StarRating):
 async def delete_tourist_feedback(assessId: UUID, touristId: UUID):
     if approved_users.get(touristId) is None and feedback_tour.get(assessId):
         raise PostFeedbackException(detail='tourist and tour details invalid', status_code=403)
-    post_delete = [access for access in feedback_tour.values() if access.id == assessId]
-    for access in post_delete:
-        is_owner = await check_post_owner(feedback_tour, access.id, touristId)
+    if feedback_tour.get(assessId) is not None:
+        is_owner = await check_post_owner(feedback_tour, assessId, touristId)
         if is_owner:
-            del feedback_tour[access.id]
+            assessment = feedback_tour.pop(assessId)
+            assessments_by_tourist.remove(touristId, assessId)
+            tour_rating_stats[assessment.tour_id].remove(assessment.post.rating)
+            refresh_tour_rating(assessment.tour_id)
     return JSONResponse(content={"message": f"deleted posts of {touristId}"}, status_code=200)
 
 
 @router.get("/feedback/list")
 async def show_tourist_post(touristId: UUID):
-    print(feedback_tour)
-    tourist_posts = [assess for assess in feedback_tour.values() if assess.tourist_id == touristId]
+    tourist_posts = [feedback_tour[assessId] for assessId in assessments_by_tourist.get(touristId)]
     tourist_posts_json = jsonable_encoder(tourist_posts)
     return JSONResponse(content=tourist_posts_json, status_code=200)
+
+
+@router.get("/feedback/stats/{tid}")
+def show_tour_rating_stats(tid: UUID):
+    if tour_rating_stats.get(tid) is None:
+        raise PostRatingException(detail='tour has no assessments', status_code=404)
+    return JSONResponse(content=tour_rating_stats[tid].summary(), status_code=200)
@@ -0,0 +1,121 @@
+import math
+from collections import defaultdict
+from typing import Dict, Hashable, Iterable, List, Set, Tuple
+
+import numpy as np
+
+EARTH_RADIUS_KM = 6371.0088
+
+
+def haversine_km(lat: float, lon: float, lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    lat1, lon1 = np.radians(lat), np.radians(lon)
+    lat2, lon2 = np.radians(lats), np.radians(lons)
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+class GeoIndex:
+    """
+    经纬度网格索引：按 cell_size 度划分网格，查询时由近及远逐圈展开网格，
+    只对候选集合用向量化的 haversine 公式计算距离
+    """
+
+    def __init__(self, cell_size: float = 1.0):
+        self.cell_size = cell_size
+        self._lat_cells = math.ceil(180 / cell_size)
+        self._lon_cells = math.ceil(360 / cell_size)
+        self._cells: Dict[Tuple[int, int], Set[Hashable]] = defaultdict(set)
+        self._points: Dict[Hashable, Tuple[float, float]] = dict()
+
+    def upsert(self, key: Hashable, latitude: float, longitude: float) -> None:
+        self.remove(key)
+        self._points[key] = (latitude, longitude)
+        self._cells[self._cell_of(latitude, longitude)].add(key)
+
+    def remove(self, key: Hashable) -> None:
+        point = self._points.pop(key, None)
+        if point is not None:
+            cell = self._cell_of(*point)
+            self._cells[cell].discard(key)
+            if not self._cells[cell]:
+                del self._cells[cell]
+
+    def nearest(self, latitude: float, longitude: float, n: int) -> List[Tuple[Hashable, float]]:
+        n = min(n, len(self._points))
+        candidates, visited = list(), set()
+        ring = 0
+        max_ring = max(self._lat_cells, self._lon_cells // 2)
+        while ring <= max_ring:
+            candidates.extend(self._ring_members(latitude, longitude, ring, visited))
+            if len(candidates) >= n:
+                found = self._ranked(latitude, longitude, candidates)
+                # 未展开的网格中任何点的距离都不小于 bound，第 n 近的点已确定
+                if n == 0 or found[n - 1][1] <= self._ring_bound_km(latitude, ring):
+                    return found[:n]
+            ring += 1
+        return self._ranked(latitude, longitude, candidates)[:n]
+
+    def within_radius(self, latitude: float, longitude: float, radius_km: float) -> List[Tuple[Hashable, float]]:
+        candidates, visited = list(), set()
+        ring = 0
+        max_ring = max(self._lat_cells, self._lon_cells // 2)
+        while ring <= max_ring:
+            candidates.extend(self._ring_members(latitude, longitude, ring, visited))
+            if self._ring_bound_km(latitude, ring) >= radius_km:
+                break
+            ring += 1
+        return [(key, dist) for key, dist in self._ranked(latitude, longitude, candidates) if dist <= radius_km]
+
+    def within_box(self, min_lat: float, min_lon: float, max_lat: float, max_lon: float) -> List[Hashable]:
+        lower_i, lower_j = self._cell_of(min_lat, min_lon)
+        upper_i, upper_j = self._cell_of(max_lat, max_lon)
+        crosses_antimeridian = min_lon > max_lon
+        if crosses_antimeridian:
+            upper_j += self._lon_cells
+        # 跨越 180 度经线时最多展开一整圈，避免同一网格被访问两次
+        upper_j = min(upper_j, lower_j + self._lon_cells - 1)
+        result = list()
+        for i in range(lower_i, upper_i + 1):
+            for j in range(lower_j, upper_j + 1):
+                for key in self._cells.get((i, j % self._lon_cells), ()):
+                    lat, lon = self._points[key]
+                    in_lon = (lon >= min_lon or lon <= max_lon) if crosses_antimeridian else min_lon <= lon <= max_lon
+                    if min_lat <= lat <= max_lat and in_lon:
+                        result.append(key)
+        return result
+
+    def _cell_of(self, latitude: float, longitude: float) -> Tuple[int, int]:
+        i = min(max(int((latitude + 90) // self.cell_size), 0), self._lat_cells - 1)
+        j = int((longitude + 180) // self.cell_size) % self._lon_cells
+        return i, j
+
+    def _ring_members(self, latitude: float, longitude: float, ring: int,
+                      visited: Set[Tuple[int, int]]) -> Iterable[Hashable]:
+        ci, cj = self._cell_of(latitude, longitude)
+        for di in range(-ring, ring + 1):
+            i = ci + di
+            if i < 0 or i >= self._lat_cells:
+                continue
+            steps = range(-ring, ring + 1) if abs(di) == ring else (-ring, ring)
+            for dj in steps:
+                cell = (i, (cj + dj) % self._lon_cells)
+                if cell in visited:
+                    continue
+                visited.add(cell)
+                yield from self._cells.get(cell, ())
+
+    def _ring_bound_km(self, latitude: float, ring: int) -> float:
+        # 第 ring 圈以外的点，纬度差或经度差至少为 ring * cell_size 度
+        spread = math.radians(min(ring * self.cell_size, 90.0))
+        return EARTH_RADIUS_KM * math.asin(math.cos(math.radians(latitude)) * math.sin(spread))
+
+    def _ranked(self, latitude: float, longitude: float, keys: List[Hashable]) -> List[Tuple[Hashable, float]]:
+        if not keys:
+            return list()
+        coords = np.array([self._points[key] for key in keys], dtype=float)
+        distances = haversine_km(latitude, longitude, coords[:, 0], coords[:, 1])
+        order = np.argsort(distances, kind="stable")
+        return [(keys[pos], float(distances[pos])) for pos in order]
+
+    def __len__(self):
+        return len(self._points)
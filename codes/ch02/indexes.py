@@ -0,0 +1,33 @@
+from collections import defaultdict
+from typing import Dict, Hashable, List
+
+
+class SecondaryIndex:
+    """
+    二级索引：属性值 -> 主键集合（按插入顺序），
+    使按属性过滤的接口只需访问命中的记录，而不用扫描整张表
+    """
+
+    def __init__(self):
+        self._postings: Dict[Hashable, Dict[Hashable, None]] = defaultdict(dict)
+
+    def add(self, key: Hashable, id: Hashable) -> None:
+        self._postings[key][id] = None
+
+    def remove(self, key: Hashable, id: Hashable) -> None:
+        ids = self._postings.get(key)
+        if ids is not None:
+            ids.pop(id, None)
+            if not ids:
+                del self._postings[key]
+
+    def move(self, old_key: Hashable, new_key: Hashable, id: Hashable) -> None:
+        if old_key != new_key:
+            self.remove(old_key, id)
+        self.add(new_key, id)
+
+    def get(self, key: Hashable) -> List[Hashable]:
+        return list(self._postings.get(key, ()))
+
+    def count(self, key: Hashable) -> int:
+        return len(self._postings.get(key, ()))
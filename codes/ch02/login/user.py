@@ -4,6 +4,8 @@ from pydantic import BaseModel
 from fastapi.encoders import jsonable_encoder
 from fastapi.responses import JSONResponse
 from background import audit_log_transaction
+from indexes import SecondaryIndex
+from ranking import RankingIndex
 
 from places.destination import TourBasicInfo
 
@@ -14,6 +16,8 @@ router = APIRouter()
 
 pending_users = dict()
 approved_users = dict()
+visitor_ranking = RankingIndex()
+tourists_by_username = SecondaryIndex()
 
 
 class Signup(BaseModel):
@@ -64,8 +68,8 @@ def login(login: User, bg_task: BackgroundTasks):
 
 @router.get("/ch02/user/login/{username}/{password}")
 def login(username: str, password: str, bg_task: BackgroundTasks):
-    tourist_list = [tourist for tourist in approved_users.values() if
-                    tourist['login']['username'] == username and tourist['login']['password'] == password]
+    tourist_list = [approved_users[tid] for tid in tourists_by_username.get(username) if
+                    approved_users[tid]['login']['password'] == password]
     if len(tourist_list) == 0 or tourist_list is None:
         return JSONResponse(content={"message": "invalid operation"}, status_code=status.HTTP_403_FORBIDDEN)
     else:
@@ -4,6 +4,8 @@ from fastapi.responses import PlainTextResponse
 from starlette.exceptions import HTTPException as GlobalStarletteHTTPException
 from fastapi.exceptions import RequestValidationError
 from handler_exceptions import PostFeedbackException, PostRatingException
+from request_logger import AsyncLogSink
+from background import audit_trail
 from fastapi.responses import JSONResponse
 
 from admin import manager
@@ -14,6 +16,7 @@ from tourist import visit
 from datetime import datetime
 
 app = FastAPI()
+request_log = AsyncLogSink("request_log.txt")
 
 app.include_router(manager.router)
 app.include_router(user.router)
@@ -25,20 +28,32 @@ app.include_router(
 )
 
 
+@app.on_event("startup")
+def start_log_sinks():
+    request_log.start()
+
+
+@app.on_event("shutdown")
+async def close_log_sinks():
+    await request_log.stop()
+    audit_trail.close()
+
+
 @app.middleware("http")
 async def log_transaction_filter(request: Request, call_next):
-    start_time = datetime.now()
+    received_at = datetime.now()
     method_name = request.method
     qp_map = request.query_params
     pp_map = request.path_params
-    with open("request_log.txt", mode="a") as reqfile:
-        content = f"method: {method_name}, query param: {qp_map}, path params: {pp_map} received at {datetime.now()}"
-        reqfile.write(content)
-        reqfile.write("\n")
-    response = await call_next(request)
-    process_time = datetime.now() - start_time
-    response.headers["X-Time-Elapsed"] = str(process_time)
-    return response
+    start_time = datetime.now()
+    try:
+        response = await call_next(request)
+        process_time = datetime.now() - start_time
+        response.headers["X-Time-Elapsed"] = str(process_time)
+        return response
+    finally:
+        # 处理中抛出异常的请求也要记录
+        request_log.emit(f"method: {method_name}, query param: {qp_map}, path params: {pp_map} received at {received_at}")
 
 
 @app.get("/ch02")
@@ -46,6 +61,11 @@ def index():
     return {"message": "Intelligent Tourist System Prototype!"}
 
 
+@app.get("/ch02/logs/stats")
+def log_stats():
+    return request_log.stats()
+
+
 @app.exception_handler(PostFeedbackException)
 def feedback_exception_handler(req: Request, ex: PostFeedbackException):
     return JSONResponse(
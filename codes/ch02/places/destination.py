@@ -1,5 +1,5 @@
-from fastapi import APIRouter, Response
-from typing import List, NamedTuple
+from fastapi import APIRouter, Header, Query, Response, status
+from typing import List, NamedTuple, Optional
 from pydantic import BaseModel
 from fastapi.encoders import jsonable_encoder
 from fastapi.responses import JSONResponse
@@ -8,11 +8,20 @@ from datetime import datetime
 from uuid import UUID
 from enum import Enum, IntEnum
 
+from catalog_cache import CatalogCache
+from geo_index import GeoIndex
+from indexes import SecondaryIndex
+from ranking import RankingIndex
+
 router = APIRouter()
 
 tours = dict()
 tours_basic_info = dict()
 tours_locations = dict()
+tour_ranking = RankingIndex()
+tour_geo_index = GeoIndex()
+tours_catalog = CatalogCache(lambda: tours)
+tours_by_availability = SecondaryIndex()
 
 
 class StarRating(IntEnum):
@@ -99,11 +108,15 @@ class TourPreference(str, Enum):
 
 
 @router.get("/ch02/destinations/list/all")
-def list_tour_destinations():
-    tours_json = jsonable_encoder(tours)
+def list_tour_destinations(if_none_match: Optional[str] = Header(None)):
+    tours_json, etag = tours_catalog.get()
     resp_headers = {'X-Access-Tours': 'Try Us', 'X-Contact-Details': '1-900-888-TOLL',
-                    'Set-Cookie': 'AppName=ITS; Max-Age=3600; Version=1'}
-    return JSONResponse(content=tours_json, headers=resp_headers)
+                    'Set-Cookie': 'AppName=ITS; Max-Age=3600; Version=1', 'ETag': etag}
+    if if_none_match is not None:
+        client_etags = [tag.strip().removeprefix('W/') for tag in if_none_match.split(',')]
+        if etag in client_etags or '*' in client_etags:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={'ETag': etag})
+    return Response(content=tours_json, media_type="application/json", headers=resp_headers)
 
 
 @router.get("/ch02/destinations/details/{id}")
@@ -123,9 +136,32 @@ def show_amenities(id: UUID):
 
 
 @router.get("/ch02/destinations/mostbooked")
-def check_recommended_tour(resp: Response):
+def check_recommended_tour(resp: Response, limit: Optional[int] = Query(None, ge=1)):
     resp.headers['X-Access-Tours'] = 'TryUs'
     resp.headers['X-Contact-Details'] = '1900888TOLL'
     resp.headers['Content-Language'] = 'en-US'
-    ranked_desc_rates = sort_orders = sorted(tours.items(), key=lambda x: x[1].ratings, reverse=True)
+    ranked_desc_rates = [(tid, tours[tid]) for tid in tour_ranking.top(limit)]
     return ranked_desc_rates
+
+
+@router.get("/ch02/destinations/nearest")
+def list_nearest_tours(latitude: float = Query(..., ge=-90, le=90), longitude: float = Query(..., ge=-180, le=180),
+                       limit: int = Query(5, ge=1, le=100)):
+    nearest = [{"tour": tours_locations[tid], "distance_km": dist}
+               for tid, dist in tour_geo_index.nearest(latitude, longitude, limit)]
+    return JSONResponse(content=jsonable_encoder(nearest))
+
+
+@router.get("/ch02/destinations/within/radius")
+def list_tours_within_radius(latitude: float = Query(..., ge=-90, le=90),
+                             longitude: float = Query(..., ge=-180, le=180), radius_km: float = Query(..., gt=0)):
+    nearby = [{"tour": tours_locations[tid], "distance_km": dist}
+              for tid, dist in tour_geo_index.within_radius(latitude, longitude, radius_km)]
+    return JSONResponse(content=jsonable_encoder(nearby))
+
+
+@router.get("/ch02/destinations/within/box")
+def list_tours_within_box(min_lat: float = Query(..., ge=-90, le=90), min_lon: float = Query(..., ge=-180, le=180),
+                          max_lat: float = Query(..., ge=-90, le=90), max_lon: float = Query(..., ge=-180, le=180)):
+    inside = [tours_locations[tid] for tid in tour_geo_index.within_box(min_lat, min_lon, max_lat, max_lon)]
+    return JSONResponse(content=jsonable_encoder(inside))
@@ -0,0 +1,53 @@
+import heapq
+from itertools import count
+from typing import Dict, Hashable, List, Optional, Tuple
+
+
+class RankingIndex:
+    """
+    增量维护的降序排行索引：更新分数时压入新条目，旧条目惰性失效，
+    top-k 查询沿堆结构做最佳优先遍历，代价为 O(k log n)，无需对全表重新排序
+    """
+
+    def __init__(self):
+        self._heap: List[Tuple[float, int, Hashable]] = list()
+        self._entries: Dict[Hashable, Tuple[float, int]] = dict()
+        self._seq = count()
+
+    def update(self, key: Hashable, score: float) -> None:
+        entry = (-score, next(self._seq))
+        self._entries[key] = entry
+        heapq.heappush(self._heap, (*entry, key))
+        self._compact()
+
+    def remove(self, key: Hashable) -> None:
+        if self._entries.pop(key, None) is not None:
+            self._compact()
+
+    def score(self, key: Hashable) -> Optional[float]:
+        entry = self._entries.get(key)
+        return None if entry is None else -entry[0]
+
+    def top(self, k: Optional[int] = None) -> List[Hashable]:
+        if k is None:
+            k = len(self._entries)
+        result = list()
+        heap = self._heap
+        frontier = [(heap[0], 0)] if heap else []
+        while frontier and len(result) < k:
+            (neg_score, seq, key), pos = heapq.heappop(frontier)
+            if self._entries.get(key) == (neg_score, seq):
+                result.append(key)
+            for child in (2 * pos + 1, 2 * pos + 2):
+                if child < len(heap):
+                    heapq.heappush(frontier, (heap[child], child))
+        return result
+
+    def _compact(self) -> None:
+        # 失效条目超过有效条目时重建堆，保证查询时跳过的旧条目有上界
+        if len(self._heap) > 2 * len(self._entries) + 16:
+            self._heap = [(*entry, key) for key, entry in self._entries.items()]
+            heapq.heapify(self._heap)
+
+    def __len__(self):
+        return len(self._entries)
@@ -0,0 +1,52 @@
+import math
+
+
+class RatingAggregate:
+    """
+    单条线路的评分聚合：记录条数、总和、平方和以及 1-5 星分布，
+    新增、修改、删除评论时 O(1) 更新，均值和方差无需重新扫描评论
+    """
+
+    __slots__ = ("count", "total", "total_sq", "histogram")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0
+        self.total_sq = 0
+        self.histogram = [0] * 5
+
+    def add(self, rating: int) -> None:
+        self.count += 1
+        self.total += rating
+        self.total_sq += rating * rating
+        self.histogram[rating - 1] += 1
+
+    def remove(self, rating: int) -> None:
+        self.count -= 1
+        self.total -= rating
+        self.total_sq -= rating * rating
+        self.histogram[rating - 1] -= 1
+
+    def replace(self, old_rating: int, new_rating: int) -> None:
+        self.remove(old_rating)
+        self.add(new_rating)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    @property
+    def variance(self) -> float:
+        if not self.count:
+            return 0.0
+        # 评分均为整数，总和与平方和精确无误差，这里只防止浮点舍入出现负数
+        return max(self.total_sq / self.count - self.mean ** 2, 0.0)
+
+    def summary(self) -> dict:
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "variance": self.variance,
+            "stddev": math.sqrt(self.variance),
+            "distribution": {str(star): n for star, n in enumerate(self.histogram, start=1)},
+        }
@@ -0,0 +1,99 @@
+import asyncio
+import os
+from typing import List, Optional
+
+
+class AsyncLogSink:
+    """
+    异步批量日志：中间件只负责入队，后台任务按批量大小或时间间隔写入文件，
+    文件超过 max_bytes 时滚动；队列积压时先采样，队列满时直接丢弃
+    """
+
+    def __init__(self, path: str = "request_log.txt", batch_size: int = 100, flush_interval: float = 1.0,
+                 max_bytes: int = 10 * 1024 * 1024, backup_count: int = 3, max_queue: int = 10000,
+                 sample_every: int = 10):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.max_queue = max_queue
+        self.high_watermark = int(max_queue * 0.8)
+        self.sample_every = sample_every
+        self.dropped = 0
+        self.sampled_out = 0
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        self._batch_ready = asyncio.Event()
+        self._stopping = False
+        self._task: Optional[asyncio.Task] = None
+        self._file = None
+        self._seen = 0
+
+    def emit(self, line: str) -> None:
+        self._seen += 1
+        if self._queue.qsize() >= self.high_watermark and self._seen % self.sample_every != 0:
+            self.sampled_out += 1
+            return
+        try:
+            self._queue.put_nowait(line)
+        except asyncio.QueueFull:
+            self.dropped += 1
+            return
+        if self._queue.qsize() >= self.batch_size:
+            self._batch_ready.set()
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        # 通知后台任务写完队列中剩余的日志后退出，不在写文件途中取消
+        self._stopping = True
+        self._batch_ready.set()
+        if self._task is not None:
+            await self._task
+            self._task = None
+        await self._flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._batch_ready.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._batch_ready.clear()
+            await self._flush()
+
+    async def _flush(self) -> None:
+        while not self._queue.empty():
+            batch = list()
+            while len(batch) < self.batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            await asyncio.to_thread(self._write, batch)
+
+    def _write(self, batch: List[str]) -> None:
+        content = "\n".join(batch) + "\n"
+        if self._file is None:
+            self._file = open(self.path, mode="a")
+        if self._file.tell() + len(content) > self.max_bytes:
+            self._rotate()
+        self._file.write(content)
+        self._file.flush()
+
+    def _rotate(self) -> None:
+        self._file.close()
+        for i in range(self.backup_count - 1, 0, -1):
+            src = f"{self.path}.{i}"
+            if os.path.exists(src):
+                os.replace(src, f"{self.path}.{i + 1}")
+        if self.backup_count > 0:
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+        self._file = open(self.path, mode="a")
+
+    def stats(self) -> dict:
+        return {"queued": self._queue.qsize(), "dropped": self.dropped, "sampled_out": self.sampled_out}
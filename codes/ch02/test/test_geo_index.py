@@ -0,0 +1,22 @@
+from geo_index import GeoIndex
+
+
+def test_within_box_crossing_antimeridian():
+    index = GeoIndex()
+    index.upsert("fiji", -17.7, 178.0)
+    index.upsert("samoa", -13.8, -172.1)
+    index.upsert("manila", 14.6, 121.0)
+    assert sorted(index.within_box(-20, 170, -10, -170)) == ["fiji", "samoa"]
+
+
+def test_within_box_wrapping_same_cell_visits_once():
+    index = GeoIndex()
+    index.upsert("a", 10, 50.95)
+    assert index.within_box(0, 50.9, 20, 50.2) == ["a"]
+
+
+def test_within_box_regular():
+    index = GeoIndex()
+    index.upsert("a", 10, 10)
+    index.upsert("b", 30, 10)
+    assert index.within_box(0, 0, 20, 20) == ["a"]
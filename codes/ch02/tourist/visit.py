@@ -5,8 +5,9 @@ from pydantic import BaseModel
 from datetime import datetime
 from uuid import UUID, uuid1
 
-from places.destination import TourBasicInfo, TourPreference, tours, tours_locations
-from login.user import approved_users
+from places.destination import TourBasicInfo, TourPreference, tours, tours_locations, tours_catalog, \
+    tours_by_availability
+from login.user import approved_users, visitor_ranking
 
 router = APIRouter()
 
@@ -40,8 +41,11 @@ def create_booking(tour: TourBasicInfo, touristId: UUID):
     print(approved_users[touristId])
     approved_users[touristId]['tours'].append(tour)
     approved_users[touristId]['booked'] += 1
+    visitor_ranking.update(touristId, approved_users[touristId]['booked'])
+    tours_by_availability.move(tours[tour.id].isBooked, True, tour.id)
     tours[tour.id].isBooked = True
     tours[tour.id].visits += 1
+    tours_catalog.invalidate()
     return booking
 
 
@@ -69,5 +73,5 @@ def show_location(tid: UUID):
 
 @router.get("/ch02/tourist/tour/available")
 def show_available_tours():
-    available_tours = [t for t in tours.values() if t.isBooked is False]
+    available_tours = [tours[tid] for tid in tours_by_availability.get(False)]
     return available_tours
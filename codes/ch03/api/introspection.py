@@ -0,0 +1,24 @@
+from fastapi import APIRouter
+
+from dependencies.resolution import resolution_plans
+from repository.aggregates import request_stats, user_type_stats
+
+router = APIRouter()
+
+
+@router.get("/introspection/requests")
+def list_request_stats():
+    return request_stats.snapshot()
+
+
+@router.get("/introspection/users/types")
+def list_user_type_stats():
+    merged = user_type_stats.merged_counts()
+    return {"worker": user_type_stats.local_counts(), "all_workers": merged["counts"],
+            "live_workers": sum(1 for worker in merged["workers"].values() if worker["live"]),
+            "workers": merged["workers"]}
+
+
+@router.get("/introspection/dependencies")
+def list_resolution_plans():
+    return resolution_plans.all()
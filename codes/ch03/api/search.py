@@ -0,0 +1,32 @@
+from typing import List
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.encoders import jsonable_encoder
+
+from repository.factory import get_search_repo
+
+router = APIRouter()
+
+
+@router.get("/search/recipes/ingredients")
+def search_recipes_by_ingredients(ingredients: List[str] = Query(...), searchrepo=Depends(get_search_repo)):
+    recipes_json = jsonable_encoder(searchrepo.query_recipes_with_ingredients(ingredients))
+    return recipes_json
+
+
+@router.get("/search/recipes/keywords")
+def search_recipes_by_keywords(keywords: List[str] = Query(...), limit: int = Query(10, ge=1, le=100),
+                               searchrepo=Depends(get_search_repo)):
+    ranked = searchrepo.query_ranked_keywords(keywords, limit)
+    return jsonable_encoder([{"id": rid, "score": score} for rid, score in ranked])
+
+
+@router.get("/search/autocomplete/ingredients")
+def autocomplete_ingredients(prefix: str, limit: int = Query(10, ge=1, le=100),
+                             searchrepo=Depends(get_search_repo)):
+    return searchrepo.autocomplete_ingredients(prefix, limit)
+
+
+@router.get("/search/autocomplete/keywords")
+def autocomplete_keywords(prefix: str, limit: int = Query(10, ge=1, le=100), searchrepo=Depends(get_search_repo)):
+    return searchrepo.autocomplete_keywords(prefix, limit)
@@ -0,0 +1,141 @@
+"""
+依赖注入开销测试：按依赖图深度比较四种注入方式每个请求的解析开销
+- depends：FastAPI Depends 可调用类链，每个请求逐层构造（ch03 改造前的 repository/factory.py 写法）
+- registry：ProviderRegistry 单例 + async 提供者，依赖图在启动时解析（当前 repository/factory.py 写法）
+- di-factory / di-singleton：dependency_injector 容器的 Factory / Singleton 提供者链
+- lagom：Lagom 容器按构造函数类型注解自动装配
+直接以 ASGI 方式调用应用，避免 HTTP 客户端开销淹没差异，
+运行方式：python benchmark_di.py
+"""
+import asyncio
+import time
+
+from dependency_injector import containers, providers
+from fastapi import Depends, FastAPI
+from lagom import Container
+from lagom.integrations.fast_api import FastApiIntegration
+
+from dependencies.lifetimes import ProviderRegistry, Scope
+
+
+def depends_chain(depth: int):
+    class Level0:
+        def __init__(self):
+            pass
+
+    level = Level0
+    for _ in range(depth - 1):
+        def make(prev):
+            class Level:
+                def __init__(self, dep=Depends(prev)):
+                    self.dep = dep
+
+            return Level
+
+        level = make(level)
+    return Depends(level)
+
+
+def typed_chain(depth: int):
+    class Level0:
+        def __init__(self):
+            pass
+
+    levels = [Level0]
+    for _ in range(depth - 1):
+        def make(prev):
+            class Level:
+                def __init__(self, dep: prev):
+                    self.dep = dep
+
+            return Level
+
+        levels.append(make(levels[-1]))
+    return levels
+
+
+def registry_chain(depth: int):
+    levels = typed_chain(depth)
+    registry = ProviderRegistry()
+    registry.register(levels[0], scope=Scope.singleton)
+    for prev, level in zip(levels, levels[1:]):
+        registry.register(level, lambda level=level, prev=prev: level(registry.resolve(prev)), scope=Scope.singleton)
+    registry.startup()
+
+    async def provide():
+        return registry.resolve(levels[-1])
+
+    return Depends(provide)
+
+
+def dependency_injector_chain(depth: int, provider_type):
+    levels = typed_chain(depth)
+    container = containers.DynamicContainer()
+    prev_provider = provider_type(levels[0])
+    for level in levels[1:]:
+        prev_provider = provider_type(level, dep=prev_provider)
+    container.top = prev_provider
+
+    def provide():
+        return container.top()
+
+    return Depends(provide)
+
+
+def lagom_chain(depth: int):
+    levels = typed_chain(depth)
+    deps = FastApiIntegration(Container())
+    return deps.depends(levels[-1])
+
+
+STYLES = {
+    "depends": depends_chain,
+    "registry": registry_chain,
+    "di-factory": lambda depth: dependency_injector_chain(depth, providers.Factory),
+    "di-singleton": lambda depth: dependency_injector_chain(depth, providers.Singleton),
+    "lagom": lagom_chain,
+}
+
+
+def build_app(dependency) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/bench")
+    def bench(service=dependency):
+        return {"ok": True}
+
+    return app
+
+
+async def call(app: FastAPI):
+    scope = {"type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+             "scheme": "http", "path": "/bench", "raw_path": b"/bench", "root_path": "", "query_string": b"",
+             "headers": [], "client": ("127.0.0.1", 1), "server": ("127.0.0.1", 80)}
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    await app(scope, receive, send)
+
+
+async def measure(app: FastAPI, requests: int) -> float:
+    for _ in range(50):
+        await call(app)
+    start = time.perf_counter()
+    for _ in range(requests):
+        await call(app)
+    return (time.perf_counter() - start) / requests * 1e6
+
+
+def run(depths=(1, 2, 4, 8), requests: int = 2000):
+    print(f"{'style':>14}" + "".join(f"{f'depth {d} (us)':>16}" for d in depths))
+    for name, chain in STYLES.items():
+        row = [asyncio.run(measure(build_app(chain(depth)), requests)) for depth in depths]
+        print(f"{name:>14}" + "".join(f"{us:>16.1f}" for us in row))
+
+
+if __name__ == '__main__':
+    run()
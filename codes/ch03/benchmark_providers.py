@@ -0,0 +1,53 @@
+"""
+提供者生命周期性能测试：比较旧的每请求构造仓库（每次重新生成种子食谱）与单例提供者，
+统计 /ch03/recipes/list/all 每个请求的内存分配峰值、残留内存和耗时，
+运行方式：python benchmark_providers.py
+"""
+import time
+import tracemalloc
+
+from fastapi.testclient import TestClient
+
+from main import app
+from repository.recipes import RecipeRepository, recipes, seed_recipes
+from service.factory import get_recipe_service
+from service.recipes import RecipeService
+
+
+def legacy_recipe_service():
+    # 还原改造前的行为：每个请求都构造仓库并重新生成种子食谱
+    seed_recipes()
+    return RecipeService(repo=RecipeRepository())
+
+
+def measure(client: TestClient, requests: int):
+    recipes.clear()
+    seed_recipes()
+    client.get("/ch03/recipes/list/all")
+    tracemalloc.start()
+    start_mem, _ = tracemalloc.get_traced_memory()
+    peak_total = 0
+    start = time.perf_counter()
+    for _ in range(requests):
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        client.get("/ch03/recipes/list/all")
+        _, peak = tracemalloc.get_traced_memory()
+        peak_total += peak - before
+    elapsed = time.perf_counter() - start
+    end_mem, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak_total / requests / 1024, (end_mem - start_mem) / 1024, elapsed / requests * 1000, len(recipes)
+
+
+def run(requests: int = 50):
+    print(f"{'style':>10} {'peak/req (KB)':>14} {'retained (KB)':>14} {'ms/req':>8} {'recipes':>8}")
+    with TestClient(app) as client:
+        app.dependency_overrides[get_recipe_service] = legacy_recipe_service
+        print("{:>10} {:>14.1f} {:>14.1f} {:>8.2f} {:>8}".format("legacy", *measure(client, requests)))
+        app.dependency_overrides.clear()
+        print("{:>10} {:>14.1f} {:>14.1f} {:>8.2f} {:>8}".format("singleton", *measure(client, requests)))
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,86 @@
+"""
+食谱模型内存测试：比较改造前的 __dict__ 类、__slots__ + 字符串驻留的类、列式食材表，
+各自存放 100k 条食谱（每条 8 种食材）时占用的内存，
+运行方式：python benchmark_recipe_memory.py
+"""
+import gc
+import random
+import tracemalloc
+from uuid import UUID, uuid1
+
+from model.classifications import Category, Origin
+from model.recipes import Ingredient, IngredientTable, IngredientView, Recipe
+
+NAMES = ['salt', 'pepper', 'large eggs', 'milk', 'olive oil', 'garlic', 'thyme', 'heavy cream', 'sugar', 'flour']
+MEASURES = ['cup', 'teaspoon', 'tablespoon', 'pieces', 'pound', 'cloves', 'drop', 'sprig']
+
+
+class LegacyIngredient:
+    def __init__(self, id, name, qty, measure):
+        self.id = id
+        self.name = name
+        self.qty = qty
+        self.measure = measure
+
+
+class LegacyRecipe:
+    def __init__(self, id, name, ingredients, cat, orig):
+        self.id = id
+        self.name = name
+        self.ingredients = ingredients
+        self.cat = cat
+        self.orig = orig
+
+
+def fresh(value: str) -> str:
+    # 模拟从 JSON 请求解析出的字符串：内容相同但各自是独立的对象
+    return "".join(list(value))
+
+
+def random_ingredients(count: int):
+    return [(str(uuid1()), random.choice(NAMES), random.random() * 4, random.choice(MEASURES)) for _ in range(count)]
+
+
+def build_legacy(rows):
+    return {rid: LegacyRecipe(rid, name, [LegacyIngredient(UUID(id), fresh(ingr_name), qty, fresh(measure))
+                                          for id, ingr_name, qty, measure in ingrs], Category.soup, Origin.asian)
+            for rid, name, ingrs in rows}
+
+
+def build_slotted(rows):
+    return {rid: Recipe(rid, name, [Ingredient(UUID(id), fresh(ingr_name), qty, fresh(measure))
+                                    for id, ingr_name, qty, measure in ingrs], Category.soup, Origin.asian)
+            for rid, name, ingrs in rows}
+
+
+def build_columnar(rows):
+    table = IngredientTable()
+    recipes = dict()
+    for rid, name, ingrs in rows:
+        start = len(table)
+        for id, ingr_name, qty, measure in ingrs:
+            table.append(id, fresh(ingr_name), qty, fresh(measure))
+        recipes[rid] = Recipe(rid, name, IngredientView(table, start, len(table)), Category.soup, Origin.asian)
+    return recipes
+
+
+def measure(build, rows) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    recipes = build(rows)
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del recipes
+    return (after - before) / 1024 / 1024
+
+
+def run(count: int = 100_000, ingredients: int = 8):
+    rows = [(uuid1(), f"recipe {i}", random_ingredients(ingredients)) for i in range(count)]
+    print(f"{'model':>10} {'MB':>10}")
+    for label, build in (("legacy", build_legacy), ("slotted", build_slotted), ("columnar", build_columnar)):
+        print(f"{label:>10} {measure(build, rows):>10.1f}")
+
+
+if __name__ == '__main__':
+    run()
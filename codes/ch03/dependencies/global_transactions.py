@@ -1,8 +1,27 @@
+import time
+
 from fastapi import Request
-from uuid import uuid1
 
-service_paths_log = dict()
+from repository.aggregates import request_stats
+
+
+def route_template(request: Request) -> str:
+    # 按路由模板统计，带路径参数的路由不会因每个不同的 id 产生一个新的统计键
+    route = request.scope.get("route")
+    template = getattr(route, "path", None)
+    if template is None:
+        return request.url.path
+    path = request.scope["path"]
+    if ":path}" in template:
+        return template
+    # 较新的 FastAPI 版本中 scope["route"] 是子路由自身，模板不含 include_router 的前缀，从实际路径中补回
+    depth = template.count("/")
+    return "/".join(path.split("/")[:-depth]) + template
 
 
 def log_transaction(request: Request):
-    service_paths_log[uuid1()] = request.url.path
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        request_stats.record(route_template(request), (time.perf_counter() - start) * 1000)
@@ -0,0 +1,63 @@
+import threading
+from enum import Enum
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from fastapi import Request
+
+
+class Scope(str, Enum):
+    singleton = "singleton"
+    request = "request"
+    transient = "transient"
+
+
+class ProviderRegistry:
+    """
+    带生命周期的提供者注册表：
+    singleton 在应用内只创建一次，启动时提前创建；request 每个请求创建一次，缓存在 request.state 中；
+    transient 每次解析都重新创建
+    """
+
+    def __init__(self):
+        self._providers: Dict[Hashable, Tuple[Callable[[], Any], Scope]] = dict()
+        self._singletons: Dict[Hashable, Any] = dict()
+        self._lock = threading.Lock()
+
+    def register(self, key: Hashable, factory: Callable[[], Any] = None, scope: Scope = Scope.singleton) -> None:
+        self._providers[key] = (factory if factory is not None else key, scope)
+        self._singletons.pop(key, None)
+
+    def resolve(self, key: Hashable, request: Optional[Request] = None) -> Any:
+        factory, scope = self._providers[key]
+        if scope is Scope.transient:
+            return factory()
+        if scope is Scope.request:
+            if request is None:
+                raise RuntimeError(f"{key!r} is request scoped and needs the current request")
+            instances = getattr(request.state, "providers", None)
+            if instances is None:
+                instances = request.state.providers = dict()
+            if key not in instances:
+                instances[key] = factory()
+            return instances[key]
+        instance = self._singletons.get(key)
+        if instance is None:
+            with self._lock:
+                instance = self._singletons.get(key)
+                if instance is None:
+                    instance = factory()
+                    self._singletons[key] = instance
+        return instance
+
+    def provider(self, key: Hashable):
+        # 生成可用于 Depends 的 async 提供者；transient 注入处需声明 use_cache=False，否则同一请求内只解析一次
+        async def provide(request: Request):
+            return self.resolve(key, request)
+
+        return provide
+
+    def startup(self) -> None:
+        # 启动时提前创建所有单例，避免首个请求承担初始化开销
+        for key, (_, scope) in list(self._providers.items()):
+            if scope is Scope.singleton:
+                self.resolve(key)
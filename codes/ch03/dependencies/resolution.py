@@ -0,0 +1,66 @@
+import inspect
+from typing import Dict, List
+
+from fastapi.routing import APIRoute
+
+
+def is_async_dependency(call) -> bool:
+    if inspect.isclass(call):
+        return False
+    target = call if inspect.isfunction(call) or inspect.ismethod(call) else getattr(call, "__call__", call)
+    return inspect.iscoroutinefunction(target) or inspect.isasyncgenfunction(target)
+
+
+class ResolutionPlans:
+    """
+    依赖解析报告：启动时遍历每个路由（含应用级依赖）的依赖图一次，记录解析顺序、深度和同步节点数，
+    供 /introspection/dependencies 查看哪些路由每个请求仍要调度线程池；
+    只用于诊断，请求中的依赖解析仍由 FastAPI 完成
+    """
+
+    def __init__(self):
+        self._plans: Dict[str, dict] = dict()
+
+    def compile(self, routes) -> None:
+        plans = dict()
+        for route in self._api_routes(routes):
+            order: List[dict] = list()
+            depth = self._walk(route.dependant, order, 0)
+            for method in sorted(route.methods):
+                key = f"{method} {route.path}"
+                if key in plans:
+                    # 路径重复时请求只会匹配到先注册的路由
+                    continue
+                plans[key] = {
+                    "order": order,
+                    "nodes": len(order),
+                    "depth": depth,
+                    "threadpool_hops": sum(1 for node in order if not node["async"]),
+                }
+        self._plans = plans
+
+    def all(self) -> Dict[str, dict]:
+        return self._plans
+
+    def _walk(self, dependant, order: List[dict], level: int) -> int:
+        depth = level
+        for sub in dependant.dependencies:
+            depth = max(depth, self._walk(sub, order, level + 1))
+        if level > 0:
+            order.append({"name": getattr(dependant.call, "__qualname__", repr(dependant.call)),
+                          "async": is_async_dependency(dependant.call)})
+        return depth
+
+    def _api_routes(self, routes):
+        for route in routes:
+            if isinstance(route, APIRoute):
+                yield route
+            elif hasattr(route, "effective_candidates"):
+                # 较新的 FastAPI 版本中 include_router 不再把子路由展开到 app.routes，
+                # 展开后的路由才带有前缀和上层路由的依赖
+                yield from self._api_routes(route.effective_candidates())
+            elif getattr(route, "dependant", None) is not None and getattr(route, "methods", None):
+                yield route
+
+
+resolution_plans = ResolutionPlans()
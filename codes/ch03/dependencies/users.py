@@ -1,17 +1,12 @@
 from fastapi import Request, HTTPException
-from repository.aggregates import stats_user_type
-import json
+from repository.aggregates import user_type_stats
 
 
 def count_user_by_type(request: Request):
     # 创建用户的更新频率
-    try:
-        count = stats_user_type[request.query_params.get("type")]
-        count += 1
-        stats_user_type[request.query_params.get("type")] = count
-        print(json.dumps(stats_user_type))
-    except:
-        stats_user_type[request.query_params.get("type")] = 1
+    user_type = request.query_params.get("type")
+    if user_type is not None:
+        user_type_stats.count(user_type)
 
 
 def check_credential_error(request: Request):
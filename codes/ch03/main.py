@@ -1,8 +1,14 @@
 import uvicorn
 from fastapi import FastAPI, Depends
 
-from api import recipes, users, posts, login, admin, keywords, admin_mcontainer, complaints
+from api import recipes, users, posts, login, admin, keywords, admin_mcontainer, complaints, search, \
+    introspection
 from dependencies.global_transactions import log_transaction
+from dependencies.resolution import resolution_plans
+from repository.aggregates import user_type_stats
+from repository.factory import repositories
+from repository.recipes import seed_recipes
+from service.factory import services
 
 app = FastAPI(dependencies=[Depends(log_transaction)])
 
@@ -14,6 +20,22 @@ app.include_router(admin.router, prefix="/ch03")
 app.include_router(keywords.router, prefix="/ch03")
 app.include_router(admin_mcontainer.router, prefix="/ch03")
 app.include_router(complaints.router, prefix="/ch03")
+app.include_router(search.router, prefix="/ch03")
+app.include_router(introspection.router, prefix="/ch03")
+
+
+@app.on_event("startup")
+def init_providers():
+    seed_recipes()
+    repositories.startup()
+    services.startup()
+    user_type_stats.start()
+    resolution_plans.compile(app.routes)
+
+
+@app.on_event("shutdown")
+def flush_stats():
+    user_type_stats.stop()
 
 
 @app.get("/ch03")
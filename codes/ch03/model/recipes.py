@@ -1,20 +1,110 @@
+import sys
+from array import array
+from collections.abc import Sequence
 from uuid import UUID
 from model.classifications import Category, Origin
-from typing import List
+from typing import Dict, List, Union
 
 
 class Ingredient:
+    __slots__ = ("id", "name", "qty", "measure")
+
     def __init__(self, id: UUID, name: str, qty: float, measure: str):
         self.id = id
-        self.name = name
+        self.name = sys.intern(name)
         self.qty = qty
-        self.measure = measure
+        self.measure = sys.intern(measure)
+
+    def __iter__(self):
+        # jsonable_encoder 通过 dict(obj) 编码没有 __dict__ 的对象
+        for field in Ingredient.__slots__:
+            yield field, getattr(self, field)
+
+
+class IngredientTable:
+    """
+    列式食材表：数量存放在 array('d')，食材名和计量单位编码为字符串表下标存放在 array('I')，
+    UUID 以 16 字节存放在 bytearray，大量食谱共享一张表时不再为每种食材创建对象
+    """
+
+    def __init__(self):
+        self._ids = bytearray()
+        self._names = array('I')
+        self._qtys = array('d')
+        self._measures = array('I')
+        self._strings: List[str] = list()
+        self._codes: Dict[str, int] = dict()
+
+    def append(self, id: Union[UUID, str], name: str, qty: float, measure: str) -> int:
+        row = len(self._qtys)
+        self._ids += (id if isinstance(id, UUID) else UUID(id)).bytes
+        self._names.append(self._encode(name))
+        self._qtys.append(qty)
+        self._measures.append(self._encode(measure))
+        return row
+
+    def extend(self, ingredients) -> "IngredientView":
+        start = len(self)
+        for ingr in ingredients:
+            if isinstance(ingr, dict):
+                self.append(ingr["id"], ingr["name"], ingr["qty"], ingr["measure"])
+            else:
+                self.append(ingr.id, ingr.name, ingr.qty, ingr.measure)
+        return IngredientView(self, start, len(self))
+
+    def __getitem__(self, row: int) -> Ingredient:
+        return Ingredient(id=UUID(bytes=bytes(self._ids[row * 16:row * 16 + 16])),
+                          name=self._strings[self._names[row]], qty=self._qtys[row],
+                          measure=self._strings[self._measures[row]])
+
+    def __len__(self):
+        return len(self._qtys)
+
+    def _encode(self, value: str) -> int:
+        code = self._codes.get(value)
+        if code is None:
+            code = len(self._strings)
+            self._strings.append(sys.intern(value))
+            self._codes[value] = code
+        return code
+
+
+class IngredientView(Sequence):
+    __slots__ = ("table", "start", "stop")
+
+    def __init__(self, table: IngredientTable, start: int, stop: int):
+        self.table = table
+        self.start = start
+        self.stop = stop
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.table[self.start + i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("ingredient index out of range")
+        return self.table[self.start + index]
+
+    def __len__(self):
+        return self.stop - self.start
 
 
 class Recipe:
-    def __init__(self, id: UUID, name: str, ingredients: List[Ingredient], cat: Category, orig: Origin):
+    __slots__ = ("id", "name", "ingredients", "cat", "orig")
+
+    def __init__(self, id: UUID, name: str, ingredients: Union[List[Ingredient], IngredientView], cat: Category,
+                 orig: Origin):
         self.id = id
         self.name = name
-        self.ingredients = ingredients
+        if isinstance(ingredients, IngredientView):
+            self.ingredients = ingredients
+        else:
+            self.ingredients = [Ingredient(**ingr) if isinstance(ingr, dict) else ingr for ingr in ingredients]
         self.cat = cat
         self.orig = orig
+
+    def __iter__(self):
+        for field in Recipe.__slots__:
+            value = getattr(self, field)
+            yield field, list(value) if field == "ingredients" else value
@@ -1 +1,137 @@
-stats_user_type = dict()
+import json
+import os
+import tempfile
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter, deque
+from typing import Dict, List, Optional
+
+LATENCY_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000)
+
+
+class RequestStats:
+    """
+    请求统计：最近 capacity 条请求存放在环形缓冲区，另按路径累计访问次数和延迟直方图，
+    长时间运行时内存占用保持不变
+    """
+
+    def __init__(self, capacity: int = 1000):
+        self._recent = deque(maxlen=capacity)
+        self._hits: Dict[str, int] = dict()
+        self._histograms: Dict[str, List[int]] = dict()
+        self._lock = threading.Lock()
+
+    def record(self, path: str, latency_ms: float) -> None:
+        bucket = bisect_left(LATENCY_BUCKETS_MS, latency_ms)
+        with self._lock:
+            self._recent.append({"path": path, "latency_ms": latency_ms, "received_at": time.time()})
+            self._hits[path] = self._hits.get(path, 0) + 1
+            histogram = self._histograms.get(path)
+            if histogram is None:
+                histogram = self._histograms[path] = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+            histogram[bucket] += 1
+
+    def snapshot(self) -> dict:
+        labels = [f"<={bound}ms" for bound in LATENCY_BUCKETS_MS] + [f">{LATENCY_BUCKETS_MS[-1]}ms"]
+        with self._lock:
+            return {
+                "recent": list(self._recent),
+                "paths": {path: {"hits": hits, "latency": dict(zip(labels, self._histograms[path]))}
+                          for path, hits in self._hits.items()},
+            }
+
+
+request_stats = RequestStats()
+
+
+class UserTypeStats:
+    """
+    用户类型统计：每个线程只递增自己的计数器，热路径上没有锁和序列化；
+    后台线程定期把本进程合并后的计数写入共享目录下的 <pid>-<启动时间>.json，
+    读取时合并目录中所有 uvicorn 工作进程的快照；已退出进程的快照保留并继续计入总数，
+    超过三个写入周期未更新的快照只标记为已退出
+    """
+
+    def __init__(self, directory: str = os.getenv("CH03_STATS_DIR", os.path.join(tempfile.gettempdir(), "ch03-stats")),
+                 interval: float = 5.0):
+        self.directory = directory
+        self.interval = interval
+        self._local = threading.local()
+        self._counters: List[Counter] = list()
+        self._register_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._started: Optional[int] = None
+
+    def count(self, user_type: str) -> None:
+        counter = getattr(self._local, "counter", None)
+        if counter is None:
+            counter = self._local.counter = Counter()
+            with self._register_lock:
+                self._counters.append(counter)
+        counter[user_type] += 1
+
+    def local_counts(self) -> Dict[str, int]:
+        totals = Counter()
+        with self._register_lock:
+            counters = list(self._counters)
+        for counter in counters:
+            # dict(counter) 在 C 层一次复制完成，持有 GIL 期间不会与其他线程的递增交错
+            totals.update(dict(counter))
+        return dict(totals)
+
+    def snapshot_path(self) -> str:
+        # 文件名带上启动时间，pid 被新的工作进程复用时不会覆盖已退出进程的快照
+        if self._started is None:
+            self._started = time.time_ns()
+        return os.path.join(self.directory, f"{os.getpid()}-{self._started}.json")
+
+    def write_snapshot(self, stopped: bool = False) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.snapshot_path()
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, mode="w") as snapshot:
+            json.dump({"pid": os.getpid(), "counts": self.local_counts(), "written_at": time.time(),
+                       "stopped": stopped}, snapshot)
+        os.replace(tmp_path, path)
+
+    def merged_counts(self) -> dict:
+        totals, workers = Counter(), dict()
+        expired_before = time.time() - 3 * self.interval
+        if os.path.isdir(self.directory):
+            for name in os.listdir(self.directory):
+                if not name.endswith(".json"):
+                    continue
+                try:
+                    with open(os.path.join(self.directory, name)) as snapshot:
+                        data = json.load(snapshot)
+                    totals.update(data["counts"])
+                    live = not data.get("stopped") and data["written_at"] >= expired_before
+                    workers[name[:-len(".json")]] = {"pid": data.get("pid"), "live": live, "counts": data["counts"]}
+                except (OSError, ValueError, KeyError):
+                    continue
+        return {"counts": dict(totals), "workers": workers}
+
+    def start(self) -> None:
+        if self._thread is None:
+            # 启动时先写一次，本进程从一开始就出现在工作进程列表中
+            self.write_snapshot()
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="user-type-stats", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+        # 退出前写入最终计数，快照保留在目录中继续计入所有进程的总数
+        self.write_snapshot(stopped=True)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.write_snapshot()
+
+
+user_type_stats = UserTypeStats()
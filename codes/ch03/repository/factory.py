@@ -1,26 +1,40 @@
-from fastapi import Depends
+from dependencies.lifetimes import ProviderRegistry, Scope
 from repository.recipes import RecipeRepository
 from repository.posts import PostRepository
 from repository.admin import AdminRepository
 from repository.keywords import KeywordRepository
 from repository.complaints import BadRecipeRepository
+from repository.search import SearchRepository
 
+repositories = ProviderRegistry()
+repositories.register(RecipeRepository, scope=Scope.singleton)
+repositories.register(PostRepository, scope=Scope.singleton)
+repositories.register(AdminRepository, scope=Scope.singleton)
+repositories.register(KeywordRepository, scope=Scope.singleton)
+repositories.register(BadRecipeRepository, scope=Scope.singleton)
+repositories.register(SearchRepository, scope=Scope.singleton)
 
-def get_recipe_repo(repo=Depends(RecipeRepository)):
-    return repo
 
+# 单例已在启动时创建，解析只是一次字典查找，声明为 async 使 FastAPI 不再为它占用线程池
+async def get_recipe_repo():
+    return repositories.resolve(RecipeRepository)
 
-def get_post_repo(repo=Depends(PostRepository)):
-    return repo
 
+async def get_post_repo():
+    return repositories.resolve(PostRepository)
 
-def get_users_repo(repo=Depends(AdminRepository)):
-    return repo
 
+async def get_users_repo():
+    return repositories.resolve(AdminRepository)
 
-def get_keywords(keywords=Depends(KeywordRepository)):
-    return keywords
 
+async def get_keywords():
+    return repositories.resolve(KeywordRepository)
 
-def get_bad_recipes(repo=Depends(BadRecipeRepository)):
-    return repo
+
+async def get_bad_recipes():
+    return repositories.resolve(BadRecipeRepository)
+
+
+async def get_search_repo():
+    return repositories.resolve(SearchRepository)
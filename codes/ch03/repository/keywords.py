@@ -1,6 +1,8 @@
 from uuid import UUID
 from typing import List
 
+from repository.search_index import search_index
+
 keywords_recipe = dict()
 
 
@@ -11,6 +13,7 @@ class KeywordRepository:
 
     def insert_keywords(self, id: UUID, keywords: List[str]):
         keywords_recipe[id] = keywords
+        search_index.set_keywords(id, keywords)
 
     def add_keywords(self, id: UUID, keyword: str):
         if keywords_recipe.get(id) is None:
@@ -21,6 +24,7 @@ class KeywordRepository:
             keywords = keywords_recipe[id]
             keywords.append(keyword)
             keywords_recipe[id] = keywords
+        search_index.add_keywords(id, [keyword])
 
     def query_keywords(self, id: UUID):
         return keywords_recipe[id]
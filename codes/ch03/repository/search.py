@@ -0,0 +1,19 @@
+from typing import List
+
+from repository.recipes import recipes
+from repository.search_index import search_index
+
+
+class SearchRepository:
+
+    def query_recipes_with_ingredients(self, names: List[str]):
+        return [recipes[rid] for rid in search_index.recipes_with_all(names) if rid in recipes]
+
+    def query_ranked_keywords(self, keywords: List[str], limit: int):
+        return search_index.rank_by_keywords(keywords, limit)
+
+    def autocomplete_ingredients(self, prefix: str, limit: int):
+        return search_index.complete_ingredient(prefix, limit)
+
+    def autocomplete_keywords(self, prefix: str, limit: int):
+        return search_index.complete_keyword(prefix, limit)
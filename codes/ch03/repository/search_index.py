@@ -0,0 +1,156 @@
+import heapq
+import math
+import threading
+from collections import Counter, defaultdict
+from typing import Dict, Hashable, Iterable, List, Set, Tuple
+
+
+def normalize(term: str) -> str:
+    return " ".join(term.lower().split())
+
+
+class PrefixTrie:
+    """
+    前缀树：每个节点记录以该节点结尾的词条引用计数，用于食材和关键词的自动补全
+    """
+
+    def __init__(self):
+        self._root = dict()
+
+    def add(self, term: str) -> None:
+        node = self._root
+        for ch in term:
+            node = node.setdefault(ch, dict())
+        node[None] = node.get(None, 0) + 1
+
+    def discard(self, term: str) -> None:
+        path = [self._root]
+        for ch in term:
+            node = path[-1].get(ch)
+            if node is None:
+                return
+            path.append(node)
+        node = path[-1]
+        if node.get(None, 0) > 1:
+            node[None] -= 1
+            return
+        node.pop(None, None)
+        # 自底向上删除不再通向任何词条的空节点
+        for ch, parent in zip(reversed(term), reversed(path[:-1])):
+            if parent[ch]:
+                break
+            del parent[ch]
+
+    def complete(self, prefix: str, limit: int = 10) -> List[str]:
+        node = self._root
+        for ch in prefix:
+            node = node.get(ch)
+            if node is None:
+                return list()
+        result = list()
+        stack = [(node, prefix)]
+        while stack and len(result) < limit:
+            node, term = stack.pop()
+            if node.get(None):
+                result.append(term)
+            for ch in sorted((ch for ch in node if ch is not None), reverse=True):
+                stack.append((node[ch], term + ch))
+        return result
+
+
+class RecipeSearchIndex:
+    """
+    食谱倒排索引：食材名 -> 食谱 id 集合，关键词 -> {食谱 id: 词频}，
+    查询代价与倒排列表长度成正比，而不是与食谱总数成正比
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._ingredients: Dict[str, Set[Hashable]] = defaultdict(set)
+        self._keywords: Dict[str, Dict[Hashable, int]] = defaultdict(dict)
+        self._recipe_ingredients: Dict[Hashable, Set[str]] = dict()
+        self._recipe_keywords: Dict[Hashable, Counter] = dict()
+        self.ingredient_trie = PrefixTrie()
+        self.keyword_trie = PrefixTrie()
+
+    def index_recipe(self, rid: Hashable, ingredient_names: Iterable[str]) -> None:
+        names = {normalize(name) for name in ingredient_names}
+        with self._lock:
+            for name in self._recipe_ingredients.pop(rid, set()):
+                self._unlink(self._ingredients, name, rid, self.ingredient_trie)
+            for name in names:
+                self._ingredients[name].add(rid)
+                self.ingredient_trie.add(name)
+            self._recipe_ingredients[rid] = names
+
+    def set_keywords(self, rid: Hashable, keywords: Iterable[str]) -> None:
+        with self._lock:
+            for keyword in self._recipe_keywords.pop(rid, Counter()):
+                self._unlink(self._keywords, keyword, rid, self.keyword_trie)
+            self._add_keywords(rid, keywords)
+
+    def add_keywords(self, rid: Hashable, keywords: Iterable[str]) -> None:
+        with self._lock:
+            self._add_keywords(rid, keywords)
+
+    def recipes_with_all(self, ingredient_names: Iterable[str]) -> List[Hashable]:
+        names = [normalize(name) for name in ingredient_names]
+        # 读取倒排列表时同样持锁，避免写线程修改集合时迭代出错
+        with self._lock:
+            postings = [self._ingredients.get(name, set()) for name in names]
+            if not postings:
+                return list()
+            postings.sort(key=len)
+            smallest, rest = postings[0], postings[1:]
+            return [rid for rid in smallest if all(rid in posting for posting in rest)]
+
+    def rank_by_keywords(self, keywords: Iterable[str], limit: int = 10) -> List[Tuple[Hashable, float]]:
+        terms = {normalize(k) for k in keywords}
+        scores: Dict[Hashable, float] = defaultdict(float)
+        with self._lock:
+            total = len(self._recipe_keywords)
+            for keyword in terms:
+                posting = self._keywords.get(keyword)
+                if not posting:
+                    continue
+                idf = math.log(1 + total / len(posting))
+                for rid, tf in posting.items():
+                    scores[rid] += tf * idf
+        return heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+
+    def complete_ingredient(self, prefix: str, limit: int = 10) -> List[str]:
+        with self._lock:
+            return self.ingredient_trie.complete(normalize(prefix), limit)
+
+    def complete_keyword(self, prefix: str, limit: int = 10) -> List[str]:
+        with self._lock:
+            return self.keyword_trie.complete(normalize(prefix), limit)
+
+    def _add_keywords(self, rid: Hashable, keywords: Iterable[str]) -> None:
+        counts = self._recipe_keywords.setdefault(rid, Counter())
+        for keyword in map(normalize, keywords):
+            if keyword not in counts:
+                self.keyword_trie.add(keyword)
+            counts[keyword] += 1
+            self._keywords[keyword][rid] = counts[keyword]
+
+    @staticmethod
+    def _unlink(postings: dict, term: str, rid: Hashable, trie: PrefixTrie) -> None:
+        posting = postings.get(term)
+        if posting is None:
+            return
+        if isinstance(posting, dict):
+            posting.pop(rid, None)
+        else:
+            posting.discard(rid)
+        trie.discard(term)
+        if not posting:
+            del postings[term]
+
+
+search_index = RecipeSearchIndex()
+
+
+def ingredient_names(recipe) -> List[str]:
+    return [ingr.name for ingr in recipe.ingredients]
+
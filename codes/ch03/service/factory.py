@@ -1,16 +1,27 @@
-from fastapi import Depends
+from dependencies.lifetimes import ProviderRegistry, Scope
+from repository.factory import repositories
+from repository.recipes import RecipeRepository
+from repository.posts import PostRepository
+from repository.complaints import BadRecipeRepository
 from service.recipes import RecipeService
 from service.posts import PostService
 from service.complaints import BadRecipeService
 
+services = ProviderRegistry()
+services.register(RecipeService, lambda: RecipeService(repo=repositories.resolve(RecipeRepository)),
+                  scope=Scope.singleton)
+services.register(PostService, lambda: PostService(repo=repositories.resolve(PostRepository)), scope=Scope.singleton)
+services.register(BadRecipeService, lambda: BadRecipeService(recipes=repositories.resolve(BadRecipeRepository)),
+                  scope=Scope.singleton)
 
-def get_recipe_service(repo=Depends(RecipeService)):
-    return repo
 
+async def get_recipe_service():
+    return services.resolve(RecipeService)
 
-def get_post_service(repo=Depends(PostService)):
-    return repo
 
+async def get_post_service():
+    return services.resolve(PostService)
 
-def get_complaint_service(repo=Depends(BadRecipeService)):
-    return repo
+
+async def get_complaint_service():
+    return services.resolve(BadRecipeService)
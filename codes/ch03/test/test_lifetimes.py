@@ -0,0 +1,46 @@
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from dependencies.lifetimes import ProviderRegistry, Scope
+
+
+class Counter:
+    created = 0
+
+    def __init__(self):
+        Counter.created += 1
+        self.id = Counter.created
+
+
+def build_client(scope: Scope) -> TestClient:
+    registry = ProviderRegistry()
+    registry.register(Counter, scope=scope)
+    registry.startup()
+    provide = registry.provider(Counter)
+    app = FastAPI()
+
+    @app.get("/ids")
+    async def ids(first=Depends(provide, use_cache=False), second=Depends(provide, use_cache=False)):
+        return [first.id, second.id]
+
+    return TestClient(app)
+
+
+def test_singleton_shared_across_requests():
+    client = build_client(Scope.singleton)
+    first, second = client.get("/ids").json(), client.get("/ids").json()
+    assert first[0] == first[1] == second[0] == second[1]
+
+
+def test_request_scope_shared_within_request_only():
+    client = build_client(Scope.request)
+    first, second = client.get("/ids").json(), client.get("/ids").json()
+    assert first[0] == first[1]
+    assert second[0] == second[1]
+    assert first[0] != second[0]
+
+
+def test_transient_created_on_every_resolve():
+    client = build_client(Scope.transient)
+    first = client.get("/ids").json()
+    assert first[0] != first[1]
@@ -0,0 +1,73 @@
+"""
+局部更新测试：比较改造前的 jsonable_encoder + namedtuple 写法与 PatchEngine 局部更新，
+对同一组学生记录执行 100 万次更新，输出耗时以及前 1 万次更新的内存峰值，
+运行方式：python benchmark_patch.py
+"""
+import gc
+import random
+import time
+import tracemalloc
+from collections import namedtuple
+
+from fastapi.encoders import jsonable_encoder
+
+from repository.patch import patch_engine
+from student_mgt.models.data.students import Major, Student, StudentStatus
+
+legacy_results = dict()
+
+
+def new_table(count: int):
+    return {i: Student(stud_id=i, fname='Juan', lname='Dela Cruz', mname='Santos', age=18, major=Major.CS,
+                       department='Science', status=StudentStatus.Freshman) for i in range(count)}
+
+
+def random_details():
+    return random.choice([{'age': random.randint(17, 30)}, {'major': random.choice(list(Major)).value},
+                          {'status': random.choice(list(StudentStatus)).value, 'department': 'Engineering'}])
+
+
+def legacy_update(table, stud_id, details):
+    # 旧写法更新后记录变成 namedtuple，再次编码会得到列表而更新失败，
+    # 因此结果另存一处，每次都从原始的 Student 对象开始
+    profile_dict = dict(jsonable_encoder(table[stud_id]))
+    profile_dict.update(details)
+    legacy_results[stud_id] = namedtuple("Student", profile_dict.keys())(*profile_dict.values())
+
+
+def patch_update(table, stud_id, details):
+    table[stud_id] = patch_engine.apply(table[stud_id], details)
+
+
+def measure(update, updates, records: int) -> float:
+    table = new_table(records)
+    gc.collect()
+    start = time.perf_counter()
+    for stud_id, details in updates:
+        update(table, stud_id, details)
+    return time.perf_counter() - start
+
+
+def measure_peak(update, updates, records: int) -> float:
+    # tracemalloc 会显著拖慢执行，内存峰值只在前一部分更新上单独测量
+    table = new_table(records)
+    gc.collect()
+    tracemalloc.start()
+    for stud_id, details in updates:
+        update(table, stud_id, details)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1024 / 1024
+
+
+def run(count: int = 1_000_000, records: int = 1000):
+    updates = [(random.randrange(records), random_details()) for _ in range(count)]
+    print(f"{'method':>8} {'seconds':>10} {'us/update':>10} {'peak MB (10k)':>14}")
+    for label, update in (("legacy", legacy_update), ("patch", patch_update)):
+        elapsed = measure(update, updates, records)
+        peak = measure_peak(update, updates[:10_000], records)
+        print(f"{label:>8} {elapsed:>10.2f} {elapsed / count * 1e6:>10.2f} {peak:>14.1f}")
+
+
+if __name__ == '__main__':
+    run()
@@ -1,5 +1,7 @@
 import os
+import tempfile
 from datetime import date
+from typing import Optional
 
 from pydantic_settings import BaseSettings
 
@@ -30,3 +32,28 @@ class ServerSettings(BaseSettings):
 
     class Config:
         env_file = os.getcwd() + '/configuration/erp_settings.properties'
+
+
+class LibraryClientSettings(BaseSettings):
+    library_url: Optional[str] = None
+    max_connections: int = 20
+    keepalive_connections: int = 10
+    timeout: float = 10.0
+
+
+class StorageSettings(BaseSettings):
+    # 默认仍是纯内存字典；设置 STORAGE_ENGINE=log 才落盘，WAL_FSYNC=true 时每次写入都 fsync
+    storage_engine: str = 'memory'
+    data_dir: str = os.path.join(tempfile.gettempdir(), 'ch04-data')
+    snapshot_every: int = 100_000
+    wal_fsync: bool = False
+
+
+class GatewaySettings(BaseSettings):
+    # 远程实例为门户应用的根地址，格式为 "http://host:port/ch04/student=权重,..."，local_weight 为 0 时只转发到远程实例
+    local_weight: int = 1
+    student_remotes: str = ''
+    faculty_remotes: str = ''
+    library_remotes: str = ''
+    max_connections: int = 50
+    timeout: float = 10.0
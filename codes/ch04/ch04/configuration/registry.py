@@ -0,0 +1,119 @@
+import os
+import threading
+from typing import Dict, Optional, Tuple, Type, TypeVar
+
+from pydantic_settings import BaseSettings
+
+from configuration.config import FacultySettings, LibrarySettings, ServerSettings, StudentSettings
+
+T = TypeVar('T', bound=BaseSettings)
+
+
+class SettingsSnapshot:
+    """
+    某一时刻配置对象的只读快照，同一请求内的依赖共享同一个快照；
+    构造失败的配置类不在快照中，首次使用时再构造，失败只影响用到它的路由
+    """
+
+    def __init__(self, settings: Dict[type, BaseSettings], version: int):
+        self._settings = settings
+        self.version = version
+
+    def get(self, cls: Type[T]) -> T:
+        settings = self._settings.get(cls)
+        if settings is None:
+            settings = self._settings[cls] = cls()
+        return settings
+
+
+class SettingsRegistry:
+    """
+    配置注册表：每个配置类只构造一次并缓存，后台线程定期检查 env_file 的修改时间，
+    文件变化时重新构造全部配置并整体替换快照，请求处理过程中不再读取环境变量或配置文件；
+    各配置类分别构造，某个配置文件缺失或损坏时该类沿用上一次的值，不影响其他配置类
+    """
+
+    def __init__(self, *classes: Type[BaseSettings], interval: float = 2.0):
+        self._classes = classes
+        self.interval = interval
+        self._snapshot: Optional[SettingsSnapshot] = None
+        self._mtimes: Dict[str, float] = dict()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _env_files(self) -> Tuple[str, ...]:
+        files = list()
+        for cls in self._classes:
+            env_file = cls.model_config.get('env_file')
+            if isinstance(env_file, (str, os.PathLike)):
+                files.append(str(env_file))
+            elif env_file:
+                files.extend(str(path) for path in env_file)
+        return tuple(dict.fromkeys(files))
+
+    def _read_mtimes(self) -> Dict[str, float]:
+        mtimes = dict()
+        for path in self._env_files():
+            try:
+                mtimes[path] = os.stat(path).st_mtime_ns
+            except FileNotFoundError:
+                mtimes[path] = 0
+        return mtimes
+
+    def reload(self) -> SettingsSnapshot:
+        with self._lock:
+            mtimes = self._read_mtimes()
+            previous = self._snapshot
+            version = previous.version + 1 if previous else 0
+            settings = dict()
+            for cls in self._classes:
+                try:
+                    settings[cls] = cls()
+                except Exception:
+                    if previous is not None and cls in previous._settings:
+                        settings[cls] = previous._settings[cls]
+            # 先构造完整的新快照再替换引用，读取方不会看到新旧配置混合的状态
+            self._snapshot = SettingsSnapshot(settings, version)
+            self._mtimes = mtimes
+            return self._snapshot
+
+    def snapshot(self) -> SettingsSnapshot:
+        snapshot = self._snapshot
+        if snapshot is None:
+            snapshot = self.reload()
+        return snapshot
+
+    def check(self) -> bool:
+        if self._read_mtimes() != self._mtimes:
+            self.reload()
+            return True
+        return False
+
+    def _watch(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.check()
+            except Exception:
+                # 配置文件写到一半时可能解析失败，保留旧快照等待下一次检查
+                pass
+
+    def start(self):
+        self.snapshot()
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._watch, name='settings-watcher', daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+
+settings_registry = SettingsRegistry(FacultySettings, LibrarySettings, StudentSettings, ServerSettings)
+
+
+async def current_settings() -> SettingsSnapshot:
+    return settings_registry.snapshot()
@@ -1,8 +1,13 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Request
+
+from gateway.api_router import portal_gateway
 
 router = APIRouter()
 
 
 @router.get("/university/{portal_id}")
-def access_portal(portal_id: int):
+async def access_portal(portal_id: int, request: Request):
+    response = await portal_gateway.dispatch(request, portal_id)
+    if response is not None:
+        return response
     return {'message': 'University ERP Systems'}
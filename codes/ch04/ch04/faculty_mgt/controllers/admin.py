@@ -9,6 +9,7 @@ from faculty_mgt.models.request.faculty import SignupReq, FacultyReq, FacultyDet
 from faculty_mgt.services.faculty import FacultyService
 from faculty_mgt.services.login import FacultyLoginService
 from faculty_mgt.services.signup import FacultySignupService
+from repository.patch import PatchError
 
 router = APIRouter()
 
@@ -76,7 +77,10 @@ def create_profile(profile: FacultyReq):
 def update_profile(faculty_id: int, profile_details: FacultyDetails):
     profile_dict = profile_details.dict(exclude_unset=True)
     faculty_service: FacultyService = FacultyService()
-    result = faculty_service.update_faculty(faculty_id, profile_dict)
+    try:
+        result = faculty_service.update_faculty(faculty_id, profile_dict)
+    except PatchError as ex:
+        return JSONResponse(content={'message': str(ex)}, status_code=422)
     if result:
         return JSONResponse(content={'message': 'profile updated successfully'}, status_code=201)
     else:
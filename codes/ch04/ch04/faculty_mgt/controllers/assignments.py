@@ -1,11 +1,12 @@
 from datetime import datetime
+from typing import List
 
 from fastapi import APIRouter
 from fastapi.encoders import jsonable_encoder
 from fastapi.responses import JSONResponse
 
 from faculty_mgt.models.data.faculty import Assignment
-from faculty_mgt.models.request.assignment import AssignmentRequest
+from faculty_mgt.models.request.assignment import AssignmentRequest, GradeRequest
 from faculty_mgt.services.assignments import AssignmentSubmissionService, AssignmentService
 
 router = APIRouter()
@@ -42,6 +43,44 @@ def submit_assignment(assignment: AssignmentRequest):
         return JSONResponse(content={'message': 'submission problem encountered'}, status_code=500)
 
 
+@router.post('/assignments/student/submit/bulk')
+def submit_assignments(assignments: List[AssignmentRequest]):
+    submissions = list()
+    completed = datetime.now()
+    for assignment in assignments:
+        item = Assignment(title=assignment.title, date_due=assignment.date_due, course=assignment.course,
+                          assgn_id=assignment.assgn_id)
+        item.date_completed = completed
+        submissions.append((assignment.bin_id, item))
+    assignment_submission_service: AssignmentSubmissionService = AssignmentSubmissionService()
+    failed = assignment_submission_service.add_assignments(submissions)
+    if len(failed) == 0:
+        return JSONResponse(content={'submitted': len(submissions)}, status_code=201)
+    else:
+        # 部分提交成功时返回 207，由 failed 列出未成功的项
+        return JSONResponse(content={'message': 'submission problem encountered',
+                                     'submitted': len(submissions) - len(failed), 'failed': failed}, status_code=207)
+
+
+@router.post('/assignments/grade/bulk')
+def grade_assignments(grades: List[GradeRequest]):
+    assignment_submission_service: AssignmentSubmissionService = AssignmentSubmissionService()
+    failed = assignment_submission_service.grade_assignments(
+        [(grade.bin_id, grade.assgn_id, grade.rating) for grade in grades])
+    if len(failed) == 0:
+        return JSONResponse(content={'graded': len(grades)}, status_code=201)
+    else:
+        return JSONResponse(content={'message': 'grading problem encountered', 'graded': len(grades) - len(failed),
+                                     'failed': failed}, status_code=207)
+
+
+@router.get('/assignments/faculty/{faculty_id}/pending')
+def list_pending_assignments(faculty_id: int):
+    assignment_submission_service: AssignmentSubmissionService = AssignmentSubmissionService()
+    return [{'bin_id': student_bin.bin_id, 'stud_id': student_bin.stud_id, 'assignment': jsonable_encoder(pending)}
+            for student_bin, pending in assignment_submission_service.list_pending(faculty_id) if pending]
+
+
 @router.post('/assignments/student/workbin')
 def create_workbin(stud_id: int, faculty_id: int):
     assignment_submission_service: AssignmentSubmissionService = AssignmentSubmissionService()
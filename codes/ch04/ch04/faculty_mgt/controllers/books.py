@@ -1,45 +1,35 @@
-from json import dumps
-
-import requests
-from fastapi import APIRouter
+from fastapi import APIRouter, Request
 from fastapi.encoders import jsonable_encoder
 
 from faculty_mgt.models.request.library import BookRequestReq, BookReturnReq
+from gateway.catalog_cache import library_catalog
+from gateway.library_client import library_client
 
 router = APIRouter()
 
 
 @router.get('/books/access/list')
-def list_all_books():
-    with requests.Session() as sess:
-        response = sess.get('http://localhost:8000/ch04/library/book/list')
-        return response.json()
+async def list_all_books(request: Request):
+    return await library_catalog.respond(request, '/book/list')
 
 
 @router.get('/books/request/list')
-def list_all_request():
-    with requests.Session() as sess:
-        response = sess.get('http://localhost:8000/ch04/library/book/request/list', )
-        return response.json()
+async def list_all_request(request: Request):
+    return await library_catalog.respond(request, '/book/request/list')
 
 
 @router.post('/books/request/borrow')
-def request_borrow_book(request: BookRequestReq):
-    with requests.Session() as sess:
-        response = sess.post('http://localhost:8000/ch04/library/book/request', data=dumps(jsonable_encoder(request)))
-        return response.content
+async def request_borrow_book(request: BookRequestReq):
+    response = await library_client.post('/book/request', json=jsonable_encoder(request))
+    return response.content
 
 
 @router.get('/books/issuance/list')
-def list_all_issuance():
-    with requests.Session() as sess:
-        response = sess.get('http://localhost:8000/ch04/library/book/issuance/list')
-        return response.json()
+async def list_all_issuance(request: Request):
+    return await library_catalog.respond(request, '/book/issuance/list')
 
 
 @router.post('/books/returning')
-def return_book(returning: BookReturnReq):
-    with requests.Session() as sess:
-        response = sess.post('http://localhost:8000/ch04/library/book/issuance/return',
-                             data=dumps(jsonable_encoder(returning)))
-        return response.json()
+async def return_book(returning: BookReturnReq):
+    response = await library_client.post('/book/issuance/return', json=jsonable_encoder(returning))
+    return response.json()
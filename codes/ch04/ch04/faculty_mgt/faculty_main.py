@@ -1,6 +1,7 @@
 from fastapi import FastAPI, Depends
 
 from configuration.config import FacultySettings, ServerSettings
+from configuration.registry import SettingsSnapshot, current_settings
 from faculty_mgt.controllers import admin, assignments, books
 
 faculty_app = FastAPI()
@@ -9,12 +10,12 @@ faculty_app.include_router(assignments.router)
 faculty_app.include_router(books.router)
 
 
-def build_config():
-    return FacultySettings()
+async def build_config(settings: SettingsSnapshot = Depends(current_settings)):
+    return settings.get(FacultySettings)
 
 
-def fetch_config():
-    return ServerSettings()
+async def fetch_config(settings: SettingsSnapshot = Depends(current_settings)):
+    return settings.get(ServerSettings)
 
 
 @faculty_app.get('/index')
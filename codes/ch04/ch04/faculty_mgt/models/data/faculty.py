@@ -1,6 +1,6 @@
 from datetime import datetime
 from enum import Enum
-from typing import List
+from typing import Dict, Set
 
 
 class Major(str, Enum):
@@ -115,7 +115,19 @@ class StudentBin:
         self.bin_id: int = bin_id
         self.stud_id: int = stud_id
         self.faculty_id: int = faculty_id
-        self.assignment: List[Assignment] = list()
+        # 提交记录按 assgn_id 存放在保持插入顺序的字典中，插入和删除不再扫描列表
+        self.assignment: Dict[int, Assignment] = dict()
+        self.graded: Set[int] = set()
+
+    def pending(self):
+        return [work for assgn_id, work in self.assignment.items() if assgn_id not in self.graded]
+
+    def __iter__(self):
+        # jsonable_encoder 通过 dict(obj) 编码，提交记录仍输出为列表
+        yield 'bin_id', self.bin_id
+        yield 'stud_id', self.stud_id
+        yield 'faculty_id', self.faculty_id
+        yield 'assignment', list(self.assignment.values())
 
     def __repr__(self):
         return ' '.join([str(self.bin_id), str(self.stud_id), str(self.faculty_id)])
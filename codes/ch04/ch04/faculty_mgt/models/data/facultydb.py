@@ -1,9 +1,41 @@
-from typing import Dict
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, Set
 
 from faculty_mgt.models.data.faculty import Faculty, Assignment, Login, Signup, StudentBin
+from repository.fields import declare_fields
+from repository.storage import RecordCodec, durable_table
+
+declare_fields(Assignment, date_completed=datetime, rating=float)
+assignment_codec = RecordCodec(Assignment)
+
+
+class StudentBinCodec(RecordCodec):
+    """提交记录按 Assignment 的编码保存为列表，graded 保存为列表"""
+
+    def __init__(self):
+        super().__init__(StudentBin)
+
+    def encode_field(self, field: str, value):
+        if field == 'assignment':
+            return [assignment_codec.encode(work) for work in value.values()]
+        return super().encode_field(field, value)
+
+    def decode_field(self, field: str, value):
+        if field == 'assignment':
+            works = [assignment_codec.decode(record) for record in value]
+            return {work.assgn_id: work for work in works}
+        if field == 'graded':
+            return set(value)
+        return super().decode_field(field, value)
+
 
 faculty_tbl: Dict[int, Faculty] = dict()
-faculty_assignments_tbl: Dict[int, Assignment] = dict()
+faculty_assignments_tbl: Dict[int, Assignment] = durable_table('faculty_assignments', assignment_codec)
 faculty_login_tbl: Dict[int, Login] = dict()
 faculty_signup_tbl: Dict[int, Signup] = dict()
-student_bin_tbl: Dict[int, StudentBin] = dict()
+student_bin_tbl: Dict[int, StudentBin] = durable_table('student_bins', StudentBinCodec())
+
+student_bins_by_faculty: Dict[int, Set[int]] = defaultdict(set)
+for student_bin in student_bin_tbl.values():
+    student_bins_by_faculty[student_bin.faculty_id].add(student_bin.bin_id)
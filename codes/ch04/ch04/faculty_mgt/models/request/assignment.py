@@ -12,3 +12,9 @@ class AssignmentRequest(BaseModel):
     date_due: datetime
     rating: Optional[float] = None
     course: str
+
+
+class GradeRequest(BaseModel):
+    bin_id: int
+    assgn_id: int
+    rating: float
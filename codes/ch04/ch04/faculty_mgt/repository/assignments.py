@@ -1,10 +1,8 @@
-from collections import namedtuple
-from typing import Dict, Any
-
-from fastapi.encoders import jsonable_encoder
+from typing import Dict, Any, List
 
 from faculty_mgt.models.data.faculty import Assignment, StudentBin
-from faculty_mgt.models.data.facultydb import faculty_assignments_tbl, student_bin_tbl
+from faculty_mgt.models.data.facultydb import faculty_assignments_tbl, student_bin_tbl, student_bins_by_faculty
+from repository.patch import PatchError, patch_engine
 
 
 class AssignmentRepository:
@@ -18,12 +16,10 @@ class AssignmentRepository:
 
     def update_assignment(self, assgn_id: int, details: Dict[str, Any]) -> bool:
         try:
-            assignment = faculty_assignments_tbl[assgn_id]
-            assignment_enc = jsonable_encoder(assignment)
-            assignment_dict = dict(assignment_enc)
-            assignment_dict.update(details)
-            faculty_assignments_tbl[assgn_id] = namedtuple("Assignment", assignment_dict.keys())(
-                *assignment_dict.values())
+            assignment = patch_engine.apply(faculty_assignments_tbl[assgn_id], details)
+            faculty_assignments_tbl[assgn_id] = assignment
+        except PatchError:
+            raise
         except:
             return False
         return True
@@ -45,26 +41,47 @@ class AssignmentSubmissionRepository:
         try:
             student_bin = StudentBin(bin_id=bin_id, faculty_id=faculty_id, stud_id=stud_id)
             student_bin_tbl[bin_id] = student_bin
+            student_bins_by_faculty[faculty_id].add(bin_id)
         except:
             return False
         return True
 
     def insert_submission(self, bin_id: int, assignment: Assignment):
+        return self.insert_submissions(bin_id, [assignment])
+
+    def insert_submissions(self, bin_id: int, assignments: List[Assignment]):
         try:
             student_bin: StudentBin = student_bin_tbl[bin_id]
-            student_bin.assignment.append(assignment)
+            for assignment in assignments:
+                student_bin.assignment[assignment.assgn_id] = assignment
+                student_bin.graded.discard(assignment.assgn_id)
+            # 整批提交只写一次日志
+            student_bin_tbl[bin_id] = student_bin
         except:
             return False
         return True
 
     def delete_submission(self, bin_id: int, assignment: Assignment):
-        find_assignment = [work for work in student_bin_tbl[bin_id].assignment if work.assgn_id == assignment.assgn_id]
-        if len(find_assignment) == 0:
+        student_bin: StudentBin = student_bin_tbl[bin_id]
+        if student_bin.assignment.pop(assignment.assgn_id, None) is None:
             return False
-        else:
-            assignment = find_assignment[0]
-            student_bin_tbl[bin_id].assignment.remove(assignment)
-            return True
+        student_bin.graded.discard(assignment.assgn_id)
+        student_bin_tbl[bin_id] = student_bin
+        return True
+
+    def grade_submissions(self, bin_id: int, ratings: Dict[int, float]) -> List[int]:
+        student_bin: StudentBin = student_bin_tbl[bin_id]
+        missing = [assgn_id for assgn_id in ratings if assgn_id not in student_bin.assignment]
+        for assgn_id, rating in ratings.items():
+            if assgn_id in student_bin.assignment:
+                student_bin.assignment[assgn_id].rating = rating
+                student_bin.graded.add(assgn_id)
+        student_bin_tbl[bin_id] = student_bin
+        return missing
+
+    def get_pending_submissions(self, faculty_id: int):
+        return [(student_bin_tbl[bin_id], student_bin_tbl[bin_id].pending())
+                for bin_id in student_bins_by_faculty.get(faculty_id, ())]
 
     def get_submissions(self, bin_id: int):
         return student_bin_tbl[bin_id]
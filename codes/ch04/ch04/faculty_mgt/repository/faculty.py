@@ -1,10 +1,8 @@
-from collections import namedtuple
 from typing import Dict, Any
 
-from fastapi.encoders import jsonable_encoder
-
 from faculty_mgt.models.data.faculty import Faculty
 from faculty_mgt.models.data.facultydb import faculty_tbl
+from repository.patch import PatchError, patch_engine
 
 
 class FacultyRepository:
@@ -18,11 +16,9 @@ class FacultyRepository:
 
     def update_faculty(self, faculty_id: int, details: Dict[str, Any]) -> bool:
         try:
-            profile = faculty_tbl[faculty_id]
-            profile_enc = jsonable_encoder(profile)
-            profile_dict = dict(profile_enc)
-            profile_dict.update(details)
-            faculty_tbl[faculty_id] = object_name = namedtuple("Faculty", profile_dict.keys())(*profile_dict.values())
+            faculty_tbl[faculty_id] = patch_engine.apply(faculty_tbl[faculty_id], details)
+        except PatchError:
+            raise
         except:
             return False
         return True
@@ -1,4 +1,5 @@
-from typing import Dict, Any
+from collections import defaultdict
+from typing import Dict, Any, List, Tuple
 from uuid import uuid4
 
 from faculty_mgt.models.data.faculty import Assignment
@@ -40,9 +41,36 @@ class AssignmentSubmissionService:
         result = self.repo.insert_submission(bin_id, assignment)
         return result
 
+    def add_assignments(self, submissions: List[Tuple[int, Assignment]]):
+        by_bin: Dict[int, List[Assignment]] = defaultdict(list)
+        for bin_id, assignment in submissions:
+            by_bin[bin_id].append(assignment)
+        failed = list()
+        for bin_id, assignments in by_bin.items():
+            if not self.repo.insert_submissions(bin_id, assignments):
+                # assgn_id 只在所属的 bin 内唯一，失败项按 (bin_id, assgn_id) 返回
+                failed.extend({'bin_id': bin_id, 'assgn_id': assignment.assgn_id} for assignment in assignments)
+        return failed
+
     def remove_assignment(self, bin_id: int, assignment: Assignment):
-        result = self.repo.insert_submission(bin_id, assignment)
+        result = self.repo.delete_submission(bin_id, assignment)
         return result
 
+    def grade_assignments(self, grades: List[Tuple[int, int, float]]):
+        by_bin: Dict[int, Dict[int, float]] = defaultdict(dict)
+        for bin_id, assgn_id, rating in grades:
+            by_bin[bin_id][assgn_id] = rating
+        failed = list()
+        for bin_id, ratings in by_bin.items():
+            try:
+                missing = self.repo.grade_submissions(bin_id, ratings)
+            except KeyError:
+                missing = list(ratings.keys())
+            failed.extend({'bin_id': bin_id, 'assgn_id': assgn_id} for assgn_id in missing)
+        return failed
+
+    def list_pending(self, faculty_id: int):
+        return self.repo.get_pending_submissions(faculty_id)
+
     def list_assignments(self, bin_id: int):
         return self.repo.get_submissions(bin_id)
@@ -1,28 +1,104 @@
 import logging
+from typing import Dict, List, Optional
 
-from fastapi import Request
+import httpx
+from fastapi import Request, Response
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from configuration.config import GatewaySettings
 
 logger = logging.getLogger('uvicorn.access')
 
 
-def call_api_gateway(request: Request):
-    portal_id = request.path_params['portal_id']
-    print(request.path_params)
-    if portal_id == str(1):
-        raise RedirectStudentPortalException()
-    elif portal_id == str(2):
-        raise RedirectFacultyPortalException()
-    elif portal_id == str(3):
-        raise RedirectLibraryPortalException()
+class PortalTarget:
+    def __init__(self, weight: int, app: Optional[ASGIApp] = None, url: Optional[str] = None):
+        self.weight = weight
+        self.app = app
+        self.url = url
+        self.current = 0
+
+
+class PortalRoute:
+    """一个门户的转发目标，按平滑加权轮询在本进程子应用和远程实例之间选择"""
+
+    def __init__(self, mount_path: str, targets: List[PortalTarget]):
+        self.mount_path = mount_path
+        self.targets = targets
+        self.total_weight = sum(target.weight for target in targets)
+
+    def choose(self) -> PortalTarget:
+        if len(self.targets) == 1:
+            return self.targets[0]
+        for target in self.targets:
+            target.current += target.weight
+        best = max(self.targets, key=lambda target: target.current)
+        best.current -= self.total_weight
+        return best
+
+
+class ForwardResponse(Response):
+    """把当前请求的 ASGI scope 改写为子应用的 /index 后直接交给已挂载的子应用处理"""
+
+    def __init__(self, app: ASGIApp, mount_path: str):
+        super().__init__()
+        self.app = app
+        self.mount_path = mount_path
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        root_path = scope.get('root_path', '') + self.mount_path
+        child_scope = {key: value for key, value in scope.items()
+                       if key not in ('path_params', 'endpoint', 'route', 'router')}
+        child_scope.update({'method': 'GET', 'root_path': root_path, 'path': root_path + '/index',
+                            'raw_path': (root_path + '/index').encode(), 'query_string': b''})
+        await self.app(child_scope, receive, send)
+
+
+class PortalGateway:
+    """
+    门户网关：启动时编译门户编号到转发目标的路由表，
+    本进程的门户直接转发 ASGI scope，不再让客户端收到重定向后再发起第二次请求，
+    远程实例经带连接池的 httpx.AsyncClient 转发
+    """
+
+    def __init__(self, settings: GatewaySettings = None):
+        self.settings = settings or GatewaySettings()
+        self._routes: Dict[int, PortalRoute] = dict()
+        self._client: Optional[httpx.AsyncClient] = None
 
+    def compile(self, portals: Dict[int, tuple]) -> None:
+        routes = dict()
+        for portal_id, (name, mount_path, app) in portals.items():
+            targets = [PortalTarget(self.settings.local_weight, app=app)] if self.settings.local_weight > 0 else []
+            for remote in filter(None, getattr(self.settings, f'{name}_remotes').split(',')):
+                url, _, weight = remote.strip().partition('=')
+                targets.append(PortalTarget(int(weight or 1), url=url.rstrip('/')))
+            if targets:
+                routes[portal_id] = PortalRoute(mount_path, targets)
+        self._routes = routes
 
-class RedirectStudentPortalException(Exception):
-    pass
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            limits = httpx.Limits(max_connections=self.settings.max_connections)
+            self._client = httpx.AsyncClient(limits=limits, timeout=self.settings.timeout)
+        return self._client
 
+    async def dispatch(self, request: Request, portal_id: int) -> Optional[Response]:
+        route = self._routes.get(portal_id)
+        if route is None:
+            return None
+        target = route.choose()
+        if target.app is not None:
+            return ForwardResponse(target.app, route.mount_path)
+        response = await self.client.get(target.url + '/index',
+                                         headers={'X-Forwarded-For': request.client.host if request.client else ''})
+        return Response(content=response.content, status_code=response.status_code,
+                        media_type=response.headers.get('content-type'))
 
-class RedirectFacultyPortalException(Exception):
-    pass
+    async def close(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
 
-class RedirectLibraryPortalException(Exception):
-    pass
+portal_gateway = PortalGateway()
@@ -0,0 +1,57 @@
+from typing import Dict, Tuple
+
+from fastapi import Request, Response, status
+
+from gateway.library_client import LibraryClient, library_client
+from library_mgt.repository.catalog import catalog_versions, etag_matches
+
+CATALOG_PATHS: Dict[str, Tuple[str, str]] = {
+    '/book/list': ('GET', 'books'),
+    '/book/request/list': ('POST', 'requests'),
+    '/book/issuance/list': ('GET', 'issuances'),
+}
+
+
+class PortalCatalogCache:
+    """
+    学生和教师门户共用的图书馆目录缓存：按列表路径保存图书馆返回的 JSON 字节和 ETag，
+    同进程部署时订阅图书馆写操作的失效事件，未失效前不再调用图书馆；
+    远程部署时携带 If-None-Match 条件请求，图书馆返回 304 时复用缓存
+    """
+
+    def __init__(self, client: LibraryClient):
+        self.client = client
+        self._entries: Dict[str, Tuple[bytes, str]] = dict()
+        catalog_versions.subscribe(self._invalidate)
+
+    def _invalidate(self, table: str) -> None:
+        for path, (_, path_table) in CATALOG_PATHS.items():
+            if path_table == table:
+                self._entries.pop(path, None)
+
+    async def fetch(self, path: str) -> Tuple[bytes, str]:
+        method, table = CATALOG_PATHS[path]
+        entry = self._entries.get(path)
+        # 比较版本号而非只依赖失效事件：写操作可能发生在上一次获取途中
+        if entry is not None and self.client.in_process and entry[1] == catalog_versions.etag(table):
+            return entry
+        headers = {'If-None-Match': entry[1]} if entry is not None else {}
+        if method == 'GET':
+            response = await self.client.get(path, headers=headers)
+        else:
+            response = await self.client.post(path, headers=headers)
+        if response.status_code == status.HTTP_304_NOT_MODIFIED and entry is not None:
+            return entry
+        entry = (response.content, response.headers.get('ETag', ''))
+        if response.status_code == status.HTTP_200_OK and entry[1]:
+            self._entries[path] = entry
+        return entry
+
+    async def respond(self, request: Request, path: str) -> Response:
+        content, etag = await self.fetch(path)
+        if etag and etag_matches(request, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={'ETag': etag})
+        return Response(content=content, media_type='application/json', headers={'ETag': etag} if etag else None)
+
+
+library_catalog = PortalCatalogCache(library_client)
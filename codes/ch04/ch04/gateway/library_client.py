@@ -0,0 +1,49 @@
+import httpx
+
+from configuration.config import LibraryClientSettings
+
+
+class LibraryClient:
+    """
+    图书馆模块的内部调用客户端：同进程部署时经 ASGI 直接调用已挂载的 library_app，
+    不再走 localhost 回环的 TCP 连接；设置了 LIBRARY_URL 时改为带连接池和 keep-alive 的异步 HTTP 客户端
+    """
+
+    def __init__(self, settings: LibraryClientSettings = None):
+        self.settings = settings or LibraryClientSettings()
+        self._client: httpx.AsyncClient = None
+
+    @property
+    def in_process(self) -> bool:
+        return not self.settings.library_url
+
+    def _connect(self) -> httpx.AsyncClient:
+        if self.in_process:
+            # 延迟导入，避免各模块之间的循环导入
+            from library_mgt.library_main import library_app
+            return httpx.AsyncClient(transport=httpx.ASGITransport(app=library_app), base_url='http://library',
+                                     timeout=self.settings.timeout)
+        limits = httpx.Limits(max_connections=self.settings.max_connections,
+                              max_keepalive_connections=self.settings.keepalive_connections)
+        return httpx.AsyncClient(base_url=self.settings.library_url.rstrip('/'), limits=limits,
+                                 timeout=self.settings.timeout)
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = self._connect()
+        return self._client
+
+    async def get(self, path: str, **kwargs) -> httpx.Response:
+        return await self.client.get(path, **kwargs)
+
+    async def post(self, path: str, **kwargs) -> httpx.Response:
+        return await self.client.post(path, **kwargs)
+
+    async def close(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+library_client = LibraryClient()
@@ -1,10 +1,12 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Request, Response, status
 from fastapi.encoders import jsonable_encoder
 from fastapi.responses import JSONResponse
 
 from library_mgt.models.data.library import Book
 from library_mgt.models.request.library import BookReq, BookDetails
+from library_mgt.repository.catalog import catalog_versions, etag_matches
 from library_mgt.services.books import BookService
+from repository.patch import PatchError
 
 router = APIRouter()
 
@@ -24,9 +26,12 @@ def add_books(book: BookReq):
 
 # view books
 @router.get('/book/list')
-def view_books():
+def view_books(request: Request):
+    etag = catalog_versions.etag('books')
+    if etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={'ETag': etag})
     book_service = BookService()
-    return book_service.list_book()
+    return JSONResponse(content=jsonable_encoder(book_service.list_book()), headers={'ETag': etag})
 
 
 # delete book
@@ -45,7 +50,10 @@ def delete_book(book_id: int):
 def update_book_details(book_id: int, book_details: BookDetails):
     book_dict = book_details.dict(exclude_unset=True)
     book_service = BookService()
-    result = book_service.update_book(book_id, book_dict)
+    try:
+        result = book_service.update_book(book_id, book_dict)
+    except PatchError as ex:
+        return JSONResponse(content={'message': str(ex)}, status_code=422)
     if result:
         return JSONResponse(content={'message': 'book details updated successfully'}, status_code=201)
     else:
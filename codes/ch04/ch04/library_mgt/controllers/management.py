@@ -1,11 +1,12 @@
 from uuid import uuid4
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Request, Response, status
 from fastapi.encoders import jsonable_encoder
 from fastapi.responses import JSONResponse
 
 from library_mgt.models.data.library import BookIssuance, BookRequest
 from library_mgt.models.request.library import BookIssuanceReq, BookRequestReq, BookReturnReq
+from library_mgt.repository.catalog import catalog_versions, etag_matches
 from library_mgt.services.issuance import BookIssuanceService
 from library_mgt.services.reservations import BookRequestService
 
@@ -25,9 +26,12 @@ def request_book(request: BookRequestReq):
 
 
 @router.post('/book/request/list')
-def list_requests():
+def list_requests(request: Request):
+    etag = catalog_versions.etag('requests')
+    if etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={'ETag': etag})
     request_service = BookRequestService()
-    return request_service.list_book_request()
+    return JSONResponse(content=jsonable_encoder(request_service.list_book_request()), headers={'ETag': etag})
 
 
 @router.post('/book/issuance')
@@ -43,9 +47,12 @@ def approve_request(approval: BookIssuanceReq):
 
 
 @router.get('/book/issuance/list')
-def list_issuances():
+def list_issuances(request: Request):
+    etag = catalog_versions.etag('issuances')
+    if etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={'ETag': etag})
     approval_service = BookIssuanceService()
-    return approval_service.list_book_release()
+    return JSONResponse(content=jsonable_encoder(approval_service.list_book_release()), headers={'ETag': etag})
 
 
 @router.post('/book/issuance/return')
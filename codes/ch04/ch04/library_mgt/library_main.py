@@ -1,6 +1,7 @@
 from fastapi import FastAPI, Depends
 
 from configuration.config import LibrarySettings
+from configuration.registry import SettingsSnapshot, current_settings
 from library_mgt.controllers import admin, management
 
 library_app = FastAPI()
@@ -8,8 +9,8 @@ library_app.include_router(admin.router)
 library_app.include_router(management.router)
 
 
-def build_config():
-    return LibrarySettings()
+async def build_config(settings: SettingsSnapshot = Depends(current_settings)):
+    return settings.get(LibrarySettings)
 
 
 @library_app.get('/index')
@@ -1,7 +1,12 @@
+from datetime import datetime
 from typing import Dict
 
 from library_mgt.models.data.library import Book, BookRequest, BookIssuance
+from repository.fields import declare_fields
+from repository.storage import RecordCodec, durable_table
 
-book_tbl: Dict[int, Book] = dict()
-book_request_tbl: Dict[int, BookRequest] = dict()
-book_issuance_tbl: Dict[int, BookIssuance] = dict()
+declare_fields(BookIssuance, returned_date=datetime)
+
+book_tbl: Dict[int, Book] = durable_table('books', RecordCodec(Book))
+book_request_tbl: Dict[int, BookRequest] = durable_table('book_requests', RecordCodec(BookRequest))
+book_issuance_tbl: Dict[int, BookIssuance] = durable_table('book_issuances', RecordCodec(BookIssuance))
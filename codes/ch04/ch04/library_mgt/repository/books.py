@@ -1,10 +1,9 @@
-from collections import namedtuple
 from typing import Dict, Any
 
-from fastapi.encoders import jsonable_encoder
-
 from library_mgt.models.data.library import Book
 from library_mgt.models.data.librarydb import book_tbl
+from library_mgt.repository.catalog import catalog_versions
+from repository.patch import PatchError, patch_engine
 
 
 class BookRepository:
@@ -14,17 +13,17 @@ class BookRepository:
             book_tbl[book.book_id] = book
         except:
             return False
+        catalog_versions.publish('books')
         return True
 
     def update_book(self, book_id: int, details: Dict[str, Any]) -> bool:
         try:
-            profile = book_tbl[book_id]
-            profile_enc = jsonable_encoder(profile)
-            profile_dict = dict(profile_enc)
-            profile_dict.update(details)
-            book_tbl[book_id] = namedtuple("Book", profile_dict.keys())(*profile_dict.values())
+            book_tbl[book_id] = patch_engine.apply(book_tbl[book_id], details)
+        except PatchError:
+            raise
         except:
             return False
+        catalog_versions.publish('books')
         return True
 
     def delete_book(self, book_id: int) -> bool:
@@ -32,6 +31,7 @@ class BookRepository:
             del book_tbl[book_id]
         except:
             return False
+        catalog_versions.publish('books')
         return True
 
     def get_all_books(self):
@@ -0,0 +1,45 @@
+import threading
+from typing import Callable, Dict, List
+from uuid import uuid4
+
+from fastapi import Request
+
+
+class CatalogVersions:
+    """
+    图书馆目录各表的版本号：仓储写操作成功后调用 publish() 递增版本并通知订阅者，
+    列表接口以版本号作为 ETag，门户端缓存据此判断是否需要重新获取
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # 各表版本号只在本实例内存中计数，而表数据由存储引擎跨重启保留，且门户可能在多个远程实例间轮换；
+        # ETag 带上实例标识，不同实例上碰巧相同的版本号不会被当作同一份目录
+        self._boot_id = uuid4().hex[:8]
+        self._versions: Dict[str, int] = {'books': 0, 'requests': 0, 'issuances': 0}
+        self._listeners: List[Callable[[str], None]] = list()
+
+    def publish(self, table: str) -> None:
+        with self._lock:
+            self._versions[table] += 1
+            listeners = list(self._listeners)
+        for listener in listeners:
+            listener(table)
+
+    def subscribe(self, listener: Callable[[str], None]) -> None:
+        with self._lock:
+            self._listeners.append(listener)
+
+    def etag(self, table: str) -> str:
+        return f'"{table}-{self._boot_id}-{self._versions[table]}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    if_none_match = request.headers.get('If-None-Match')
+    if not if_none_match:
+        return False
+    client_etags = [tag.strip().removeprefix('W/') for tag in if_none_match.split(',')]
+    return etag in client_etags or '*' in client_etags
+
+
+catalog_versions = CatalogVersions()
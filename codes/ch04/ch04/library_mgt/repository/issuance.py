@@ -3,6 +3,7 @@ from typing import Optional
 
 from library_mgt.models.data.library import BookIssuance
 from library_mgt.models.data.librarydb import book_issuance_tbl
+from library_mgt.repository.catalog import catalog_versions
 
 
 class BookIssuanceRepository:
@@ -12,6 +13,7 @@ class BookIssuanceRepository:
             book_issuance_tbl[approved.issue_id] = approved
         except:
             return False
+        catalog_versions.publish('issuances')
         return True
 
     def update_approval_details(self, approved_id: int, book_id: Optional[int] = None, approver: Optional[str] = None):
@@ -21,8 +23,10 @@ class BookIssuanceRepository:
                 approved.book_id = book_id
             elif not approver == None:
                 approved.approved_by = approver
+            book_issuance_tbl[approved_id] = approved
         except:
             return False
+        catalog_versions.publish('issuances')
         return True
 
     def delete_approval(self, approved_id: int):
@@ -30,6 +34,7 @@ class BookIssuanceRepository:
             del book_issuance_tbl[approved_id]
         except:
             return False
+        catalog_versions.publish('issuances')
         return True
 
     def return_book(self, issue_id: int, returned_date: datetime):
@@ -40,6 +45,7 @@ class BookIssuanceRepository:
 
         except:
             return False
+        catalog_versions.publish('issuances')
         return True
 
     def get_all_approvals(self):
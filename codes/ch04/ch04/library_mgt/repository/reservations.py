@@ -1,5 +1,6 @@
 from library_mgt.models.data.library import BookRequest
 from library_mgt.models.data.librarydb import book_request_tbl
+from library_mgt.repository.catalog import catalog_versions
 
 
 class BookRequestRepository:
@@ -9,14 +10,17 @@ class BookRequestRepository:
             book_request_tbl[request.req_id] = request
         except:
             return False
+        catalog_versions.publish('requests')
         return True
 
     def update_requested_book(self, req_id: int, book_id: int):
         try:
             request = book_request_tbl[req_id]
             request.book_id = book_id
+            book_request_tbl[req_id] = request
         except:
             return False
+        catalog_versions.publish('requests')
         return True
 
     def delete_request(self, req_id: int):
@@ -24,6 +28,7 @@ class BookRequestRepository:
             del book_request_tbl[req_id]
         except:
             return False
+        catalog_versions.publish('requests')
         return True
 
     def get_all_requests(self):
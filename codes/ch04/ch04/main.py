@@ -1,20 +1,21 @@
 from uuid import uuid4
 
 import uvicorn
-from fastapi import FastAPI, Depends, Request, Response
-from fastapi.responses import RedirectResponse, JSONResponse
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
 from loguru import logger
 
+from configuration.registry import settings_registry
 from controller import university
 from faculty_mgt import faculty_main
-from gateway.api_router import call_api_gateway, RedirectStudentPortalException, RedirectFacultyPortalException, \
-    RedirectLibraryPortalException
+from gateway.api_router import portal_gateway
+from gateway.library_client import library_client
 from library_mgt import library_main
+from repository.storage import close_tables
 from student_mgt import student_main
 
 app = FastAPI()
-app.include_router(university.router,
-                   dependencies=[Depends(call_api_gateway)], prefix='/ch04')
+app.include_router(university.router, prefix='/ch04')
 logger.add("info.log", format="Log: [{extra[log_id]}: {time} - {level} - {message} ", level="INFO", enqueue=True)
 
 
@@ -33,19 +34,34 @@ async def log_middleware(request: Request, call_next):
             return response
 
 
-@app.exception_handler(RedirectStudentPortalException)
-def exception_handler_student(request: Request, exc: RedirectStudentPortalException) -> Response:
-    return RedirectResponse(url='http://localhost:8000/ch04/student/index')
+@app.on_event("startup")
+def compile_gateway_routes():
+    portal_gateway.compile({
+        1: ('student', '/ch04/student', student_main.student_app),
+        2: ('faculty', '/ch04/faculty', faculty_main.faculty_app),
+        3: ('library', '/ch04/library', library_main.library_app),
+    })
 
 
-@app.exception_handler(RedirectFacultyPortalException)
-def exception_handler_faculty(request: Request, exc: RedirectFacultyPortalException) -> Response:
-    return RedirectResponse(url='http://localhost:8000/ch04/faculty/index')
+@app.on_event("startup")
+def watch_settings():
+    settings_registry.start()
 
 
-@app.exception_handler(RedirectLibraryPortalException)
-def exception_handler_library(request: Request, exc: RedirectLibraryPortalException) -> Response:
-    return RedirectResponse(url='http://localhost:8000/ch04/library/index')
+@app.on_event("shutdown")
+async def close_clients():
+    await library_client.close()
+    await portal_gateway.close()
+
+
+@app.on_event("shutdown")
+def close_storage():
+    close_tables()
+
+
+@app.on_event("shutdown")
+def stop_settings_watcher():
+    settings_registry.stop()
 
 
 app.mount("/ch04/student", student_main.student_app)
@@ -0,0 +1,15 @@
+from typing import Dict, get_type_hints
+
+_extra_fields: Dict[type, Dict[str, type]] = dict()
+
+
+def declare_fields(cls: type, **extra_fields: type) -> None:
+    # 构造函数之外初始化的字段（如 Assignment.rating）在此声明一次类型，局部更新和落盘编码都按它转换
+    _extra_fields.setdefault(cls, dict()).update(extra_fields)
+
+
+def field_types(cls: type) -> Dict[str, type]:
+    hints = get_type_hints(cls.__init__)
+    hints.pop('return', None)
+    hints.update(_extra_fields.get(cls, dict()))
+    return hints
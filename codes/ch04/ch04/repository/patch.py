@@ -0,0 +1,97 @@
+import copy
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Callable, Dict
+
+from repository.fields import field_types
+
+BOOL_STRINGS = {'true': True, '1': True, 'false': False, '0': False}
+
+
+class PatchError(ValueError):
+    """局部更新的字段名或字段值不合法，控制器返回 422"""
+
+
+def _to_bool(value):
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, int) and value in (0, 1):
+        return bool(value)
+    if isinstance(value, str) and value.strip().lower() in BOOL_STRINGS:
+        return BOOL_STRINGS[value.strip().lower()]
+    # bool('false') 为 True，不能直接用构造函数转换
+    raise ValueError(f'{value!r} is not a boolean')
+
+
+def _to_int(value):
+    if isinstance(value, bool):
+        raise ValueError(f'{value!r} is not an integer')
+    if isinstance(value, int):
+        return value
+    if isinstance(value, float):
+        # int(2.7) 会静默截断为 2
+        if not value.is_integer():
+            raise ValueError(f'{value!r} is not an integer')
+        return int(value)
+    return int(value)
+
+
+def _to_float(value):
+    if isinstance(value, bool):
+        raise ValueError(f'{value!r} is not a number')
+    return value if type(value) is float else float(value)
+
+
+def _validator(field_type) -> Callable[[Any], Any]:
+    if isinstance(field_type, type) and issubclass(field_type, Enum):
+        return field_type
+    if field_type is datetime:
+        return lambda value: value if isinstance(value, datetime) else datetime.fromisoformat(value)
+    if field_type is date:
+        return lambda value: value if isinstance(value, date) else date.fromisoformat(value)
+    if field_type is bool:
+        return lambda value: value if value is None else _to_bool(value)
+    if field_type is int:
+        return lambda value: value if value is None else _to_int(value)
+    if field_type is float:
+        return lambda value: value if value is None else _to_float(value)
+    if field_type is str:
+        return lambda value: value if value is None or type(value) is str else str(value)
+    return lambda value: value
+
+
+class PatchEngine:
+    """
+    领域对象的局部更新：按字段类型为每个类生成一次字段校验函数并缓存，
+    更新时先校验全部字段，再在记录的浅拷贝上赋值，由调用方写回表中，
+    不再编码整条记录，也不再为每次更新创建 namedtuple 类
+    """
+
+    def __init__(self):
+        self._validators: Dict[type, Dict[str, Callable[[Any], Any]]] = dict()
+
+    def validators(self, cls: type) -> Dict[str, Callable[[Any], Any]]:
+        validators = self._validators.get(cls)
+        if validators is None:
+            validators = {field: _validator(field_type) for field, field_type in field_types(cls).items()}
+            self._validators[cls] = validators
+        return validators
+
+    def apply(self, obj, details: Dict[str, Any]):
+        validators = self.validators(type(obj))
+        values = dict()
+        for field, value in details.items():
+            if field not in validators:
+                raise PatchError(f'{type(obj).__name__} has no field {field}')
+            try:
+                values[field] = validators[field](value)
+            except (TypeError, ValueError) as ex:
+                raise PatchError(f'invalid value for {field}: {ex}') from ex
+        # 不修改表中的原对象：写日志失败时内存中的记录保持不变
+        patched = copy.copy(obj)
+        for field, value in values.items():
+            setattr(patched, field, value)
+        return patched
+
+
+patch_engine = PatchEngine()
@@ -0,0 +1,272 @@
+import gc
+import mmap
+import os
+import pickle
+import struct
+import threading
+import zlib
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Callable, Dict, List
+
+from configuration.config import StorageSettings
+from repository.fields import field_types
+
+SET = 0
+DELETE = 1
+FRAME = struct.Struct('<II')
+
+
+class RecordCodec:
+    """
+    领域对象与落盘记录之间的转换：记录是带版本号 v 的普通字典，只含内置类型，
+    类的定义改变后旧的日志和快照仍可读取，不兼容的改动提高 version 并在 upgrade 中迁移旧记录
+    """
+
+    def __init__(self, cls: type, version: int = 1, upgrade: Callable[[int, dict], dict] = None):
+        self.cls = cls
+        self.version = version
+        self.upgrade = upgrade
+        # 与 PatchEngine 共用 repository.fields 中的字段类型
+        self.field_types = field_types(cls)
+
+    def encode(self, obj) -> dict:
+        record = {field: self.encode_field(field, value) for field, value in vars(obj).items()}
+        record['v'] = self.version
+        return record
+
+    def decode(self, record: dict):
+        record = dict(record)
+        version = record.pop('v')
+        if version != self.version:
+            if self.upgrade is None:
+                raise ValueError(f'{self.cls.__name__} record version {version} is not supported')
+            record = self.upgrade(version, record)
+        obj = self.cls.__new__(self.cls)
+        for field, value in record.items():
+            setattr(obj, field, self.decode_field(field, value))
+        return obj
+
+    def encode_field(self, field: str, value):
+        if isinstance(value, Enum):
+            return value.value
+        if isinstance(value, (datetime, date)):
+            return value.isoformat()
+        if isinstance(value, set):
+            return sorted(value)
+        return value
+
+    def decode_field(self, field: str, value):
+        field_type = self.field_types.get(field)
+        if value is None or field_type is None:
+            return value
+        if field_type is datetime:
+            return datetime.fromisoformat(value)
+        if field_type is date:
+            return date.fromisoformat(value)
+        if isinstance(field_type, type) and issubclass(field_type, Enum):
+            return field_type(value)
+        return value
+
+
+class MemoryStorage:
+    """不落盘的存储引擎，保持原先纯内存字典的行为，不需要编码记录"""
+
+    def load(self) -> Dict[Any, Any]:
+        return dict()
+
+    def append(self, op: int, key, value=None) -> bool:
+        return False
+
+    def compact(self, data: Dict[Any, Any]) -> None:
+        pass
+
+    def close(self, data: Dict[Any, Any]) -> None:
+        pass
+
+
+class LogStorage:
+    """
+    追加写日志 + 压缩快照的存储引擎：每次写入在 <name>.wal 追加一条带长度和 CRC 的记录，
+    日志累计 snapshot_every 条后把整张表写成 <name>.snapshot 并清空日志，
+    启动时以 mmap 载入快照，只需重放快照之后的日志尾部；
+    日志和快照中保存的是 codec 编码后的普通字典，不是对象本身
+    """
+
+    def __init__(self, directory: str, name: str, snapshot_every: int, codec: RecordCodec, fsync: bool = True):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.snapshot_path = os.path.join(directory, f'{name}.snapshot')
+        self.wal_path = os.path.join(directory, f'{name}.wal')
+        self.snapshot_every = snapshot_every
+        self.codec = codec
+        self.fsync = fsync
+        self._pending = 0
+        self._wal = None
+
+    def load(self) -> Dict[Any, Any]:
+        # 载入时会一次创建大量对象，暂停分代回收避免反复扫描刚创建的对象
+        enabled = gc.isenabled()
+        gc.disable()
+        try:
+            return self._load()
+        finally:
+            if enabled:
+                gc.enable()
+
+    def _load(self) -> Dict[Any, Any]:
+        data = dict()
+        if os.path.exists(self.snapshot_path) and os.path.getsize(self.snapshot_path) > 0:
+            with open(self.snapshot_path, 'rb') as file, \
+                    mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                data = {key: self.codec.decode(record) for key, record in pickle.loads(mapped).items()}
+        self._pending = self._replay(data)
+        created = not os.path.exists(self.wal_path)
+        self._wal = open(self.wal_path, 'ab')
+        if created:
+            self._sync_directory()
+        return data
+
+    def _replay(self, data: Dict[Any, Any]) -> int:
+        if not os.path.exists(self.wal_path) or os.path.getsize(self.wal_path) == 0:
+            return 0
+        records = 0
+        offset = 0
+        with open(self.wal_path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            size = len(mapped)
+            while offset + FRAME.size <= size:
+                length, crc = FRAME.unpack_from(mapped, offset)
+                start = offset + FRAME.size
+                payload = mapped[start:start + length]
+                if len(payload) < length or zlib.crc32(payload) != crc:
+                    break
+                op, key, record = pickle.loads(payload)
+                if op == SET:
+                    data[key] = self.codec.decode(record)
+                else:
+                    data.pop(key, None)
+                offset = start + length
+                records += 1
+        if offset < size:
+            # 进程在写入途中退出时截掉不完整的最后一条记录
+            with open(self.wal_path, 'r+b') as file:
+                file.truncate(offset)
+        return records
+
+    def append(self, op: int, key, value=None) -> bool:
+        record = self.codec.encode(value) if op == SET else None
+        payload = pickle.dumps((op, key, record), protocol=pickle.HIGHEST_PROTOCOL)
+        self._wal.write(FRAME.pack(len(payload), zlib.crc32(payload)) + payload)
+        self._wal.flush()
+        if self.fsync:
+            # 只 flush 到页缓存时，断电会丢失已经返回成功的写入
+            os.fsync(self._wal.fileno())
+        self._pending += 1
+        return self._pending >= self.snapshot_every
+
+    def compact(self, data: Dict[Any, Any]) -> None:
+        temp_path = self.snapshot_path + '.tmp'
+        records = {key: self.codec.encode(value) for key, value in data.items()}
+        with open(temp_path, 'wb') as file:
+            pickle.dump(records, file, protocol=pickle.HIGHEST_PROTOCOL)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, self.snapshot_path)
+        # 目录项也要落盘，否则断电后可能仍看到旧快照，而日志已经被清空
+        self._sync_directory()
+        # 快照替换成功后才清空日志，中途崩溃时重放旧日志也只是重复执行幂等的写入
+        self._wal.truncate(0)
+        os.fsync(self._wal.fileno())
+        self._pending = 0
+
+    def _sync_directory(self) -> None:
+        fd = os.open(self.directory, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def close(self, data: Dict[Any, Any]) -> None:
+        if self._wal is None:
+            return
+        if self._pending:
+            self.compact(data)
+        self._wal.close()
+        self._wal = None
+
+
+class DurableTable(dict):
+    """
+    由存储引擎持久化的表：读操作与普通字典相同，写操作先写日志再修改内存，
+    原地修改的记录需要重新赋值一次才会写入日志
+    """
+
+    def __init__(self, storage):
+        super().__init__(storage.load())
+        self._storage = storage
+        self._lock = threading.RLock()
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            should_compact = self._storage.append(SET, key, value)
+            super().__setitem__(key, value)
+            if should_compact:
+                self._storage.compact(dict(self))
+
+    def __delitem__(self, key):
+        with self._lock:
+            if key not in self:
+                raise KeyError(key)
+            should_compact = self._storage.append(DELETE, key)
+            super().__delitem__(key)
+            if should_compact:
+                self._storage.compact(dict(self))
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def pop(self, key, *default):
+        if key not in self and default:
+            return default[0]
+        value = self[key]
+        del self[key]
+        return value
+
+    def popitem(self):
+        if not self:
+            raise KeyError('popitem(): dictionary is empty')
+        key = next(reversed(self))
+        return key, self.pop(key)
+
+    def clear(self):
+        for key in list(self):
+            del self[key]
+
+    def close(self):
+        with self._lock:
+            self._storage.close(dict(self))
+
+
+tables: List[DurableTable] = list()
+
+
+def durable_table(name: str, codec: RecordCodec) -> DurableTable:
+    settings = StorageSettings()
+    if settings.storage_engine == 'memory':
+        storage = MemoryStorage()
+    else:
+        storage = LogStorage(settings.data_dir, name, settings.snapshot_every, codec, settings.wal_fsync)
+    table = DurableTable(storage)
+    tables.append(table)
+    return table
+
+
+def close_tables():
+    for table in tables:
+        table.close()
@@ -9,6 +9,7 @@ from student_mgt.models.request.students import SignupReq, StudentReq, StudentDe
 from student_mgt.services.login import StudentLoginService
 from student_mgt.services.signup import StudentSignupService
 from student_mgt.services.students import StudentService
+from repository.patch import PatchError
 
 router = APIRouter()
 
@@ -77,7 +78,10 @@ def create_profile(profile: StudentReq):
 def update_profile(stud_id: int, profile_details: StudentDetails):
     profile_dict = profile_details.dict(exclude_unset=True)
     student_service: StudentService = StudentService()
-    result = student_service.update_student(stud_id, profile_dict)
+    try:
+        result = student_service.update_student(stud_id, profile_dict)
+    except PatchError as ex:
+        return JSONResponse(content={'message': str(ex)}, status_code=422)
     if result:
         return JSONResponse(content={'message': 'profile updated successfully'}, status_code=201)
     else:
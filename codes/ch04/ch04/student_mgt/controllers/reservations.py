@@ -1,24 +1,19 @@
-from json import dumps
-
-import httpx
-from fastapi import APIRouter
+from fastapi import APIRouter, Request
 from fastapi.encoders import jsonable_encoder
 
+from gateway.catalog_cache import library_catalog
+from gateway.library_client import library_client
 from student_mgt.models.request.library import BookIssuanceReq
 
 router = APIRouter()
 
 
 @router.get('/access/book')
-def access_book():
-    with httpx.Client() as client:
-        response = client.get("http://localhost:8000/ch04/library/book/list")
-        return response.json()
+async def access_book(request: Request):
+    return await library_catalog.respond(request, '/book/list')
 
 
 @router.get('/reserve/book')
-def reserve_book(book: BookIssuanceReq):
-    with httpx.Client() as client:
-        response = client.post("http://localhost:8000/ch04/library/book/issuance",
-                               data={"book": dumps(jsonable_encoder(book))})
-        return response.content
+async def reserve_book(book: BookIssuanceReq):
+    response = await library_client.post('/book/issuance', json=jsonable_encoder(book))
+    return response.content
@@ -1,7 +1,8 @@
 from typing import Dict
 
 from student_mgt.models.data.students import Login, Student, Signup
+from repository.storage import RecordCodec, durable_table
 
-students_tbl: Dict[int, Student] = dict()
+students_tbl: Dict[int, Student] = durable_table('students', RecordCodec(Student))
 stud_login_tbl: Dict[int, Login] = dict()
 stud_signup_tbl: Dict[int, Signup] = dict()
@@ -1,10 +1,8 @@
-from collections import namedtuple
 from typing import Dict, Any
 
-from fastapi.encoders import jsonable_encoder
-
 from student_mgt.models.data.students import Student
 from student_mgt.models.data.studentsdb import students_tbl
+from repository.patch import PatchError, patch_engine
 
 
 class StudentRepository:
@@ -18,11 +16,9 @@ class StudentRepository:
 
     def update_student(self, stud_id: int, details: Dict[str, Any]) -> bool:
         try:
-            profile = students_tbl[stud_id]
-            profile_enc = jsonable_encoder(profile)
-            profile_dict = dict(profile_enc)
-            profile_dict.update(details)
-            students_tbl[stud_id] = namedtuple("Student", profile_dict.keys())(*profile_dict.values())
+            students_tbl[stud_id] = patch_engine.apply(students_tbl[stud_id], details)
+        except PatchError:
+            raise
         except:
             return False
         return True
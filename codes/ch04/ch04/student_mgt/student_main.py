@@ -1,6 +1,7 @@
 from fastapi import FastAPI, Depends
 
 from configuration.config import StudentSettings, ServerSettings
+from configuration.registry import SettingsSnapshot, current_settings
 from student_mgt.controllers import reservations, admin, assignments
 
 student_app = FastAPI()
@@ -9,12 +10,12 @@ student_app.include_router(admin.router)
 student_app.include_router(assignments.router)
 
 
-def build_config():
-    return StudentSettings()
+async def build_config(settings: SettingsSnapshot = Depends(current_settings)):
+    return settings.get(StudentSettings)
 
 
-def fetch_config():
-    return ServerSettings()
+async def fetch_config(settings: SettingsSnapshot = Depends(current_settings)):
+    return settings.get(ServerSettings)
 
 
 @student_app.get('/index')
@@ -0,0 +1,68 @@
+"""
+GINO 连接池测试：比较改造前每个请求都 set_bind 的依赖与启动时绑定一次连接池两种方式下
+/ch05/classes/trainers/list 的每秒请求数（/ch05/trainer/list 已改为读取内存中的读模型，不再访问数据库），
+需要可以连接的 fcms 数据库（GINO_DB_URL），
+运行方式：python benchmark_gino_pool.py
+"""
+import asyncio
+import time
+
+import httpx
+from fastapi import Depends, FastAPI
+
+from api import trainers
+from db_config.gino_connect import DB_URL, bind_db, close_db, db, pool_metrics
+
+
+_rebind_lock = asyncio.Lock()
+
+
+async def legacy_sess_db():
+    # 改造前的写法每个请求都新建引擎和连接池，这里先关闭上一个请求的引擎，测量的只是重复建池本身的开销，
+    # 不会因为旧连接池堆积而耗尽数据库连接；并发请求依次换绑，避免两个请求同时建池时其中一个引擎无人关闭
+    async with _rebind_lock:
+        if db.is_bound():
+            await db.pop_bind().close()
+        await db.set_bind(DB_URL)
+
+
+def build_app(*dependencies) -> FastAPI:
+    app = FastAPI()
+    app.include_router(trainers.router, prefix='/ch05', dependencies=list(dependencies))
+    return app
+
+
+async def measure(app: FastAPI, requests: int, concurrency: int) -> float:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url='http://bench') as client:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def call():
+            async with semaphore:
+                response = await client.get('/ch05/classes/trainers/list')
+                response.raise_for_status()
+
+        start = time.perf_counter()
+        await asyncio.gather(*(call() for _ in range(requests)))
+        return requests / (time.perf_counter() - start)
+
+
+async def run(requests: int = 500, concurrency: int = 10):
+    before = await measure(build_app(Depends(legacy_sess_db)), requests, concurrency)
+    await close_db()
+
+    await bind_db()
+    try:
+        after = await measure(build_app(), requests, concurrency)
+        metrics = pool_metrics.snapshot()
+    finally:
+        await close_db()
+
+    print(f"{'binding':>16} {'req/s':>10}")
+    print(f"{'per request':>16} {before:>10.1f}")
+    print(f"{'app startup':>16} {after:>10.1f}")
+    print(f"pool: {metrics}")
+
+
+if __name__ == '__main__':
+    asyncio.run(run())
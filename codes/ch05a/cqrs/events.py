@@ -0,0 +1,31 @@
+import time
+from typing import Any, Awaitable, Callable, Dict, List
+
+TRAINER_SAVED = "trainer_saved"
+TRAINER_UPDATED = "trainer_updated"
+TRAINER_DELETED = "trainer_deleted"
+
+
+class DomainEvent:
+
+    def __init__(self, name: str, key: Any, data: Dict[str, Any] = None):
+        self.name = name
+        self.key = key
+        self.data: Dict[str, Any] = data or dict()
+        self.occurred = time.monotonic()
+
+
+class EventBus:
+
+    def __init__(self):
+        self._subscribers: Dict[str, List[Callable[[DomainEvent], Awaitable[None]]]] = dict()
+
+    def subscribe(self, name: str, handler: Callable[[DomainEvent], Awaitable[None]]):
+        self._subscribers.setdefault(name, list()).append(handler)
+
+    async def publish(self, event: DomainEvent):
+        for handler in self._subscribers.get(event.name, list()):
+            await handler(event)
+
+
+event_bus = EventBus()
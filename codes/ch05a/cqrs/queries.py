@@ -1,12 +1,10 @@
-from typing import List
-
-from models.data.gino_models import Profile_Trainers
+from typing import Any, Dict, List
 
 
 class ProfileTrainerListQuery:
 
     def __init__(self):
-        self._records: List[Profile_Trainers] = list()
+        self._records: List[Dict[str, Any]] = list()
 
     @property
     def records(self):
@@ -20,7 +18,7 @@ class ProfileTrainerListQuery:
 class ProfileTrainerRecordQuery:
 
     def __init__(self):
-        self._record: Profile_Trainers = None
+        self._record: Dict[str, Any] = None
 
     @property
     def record(self):
@@ -1,4 +1,5 @@
 from cqrs.commands import ProfileTrainerCommand
+from cqrs.events import DomainEvent, TRAINER_SAVED, event_bus
 from cqrs.handlers import ICommandHandler
 from repository.gino.trainers import TrainerRepository
 
@@ -10,4 +11,6 @@ class AddTrainerCommandHandler(ICommandHandler):
 
     async def handle(self, command: ProfileTrainerCommand) -> bool:
         result = await self.repo.insert_trainer(command.details)
+        if result:
+            await event_bus.publish(DomainEvent(TRAINER_SAVED, command.details["id"], command.details))
         return result
@@ -1,4 +1,5 @@
 from cqrs.commands import ProfileTrainerCommand
+from cqrs.events import DomainEvent, TRAINER_DELETED, event_bus
 from cqrs.handlers import ICommandHandler
 from repository.gino.trainers import TrainerRepository
 
@@ -10,4 +11,6 @@ class DeleteTrainerCommandHandler(ICommandHandler):
 
     async def handle(self, command: ProfileTrainerCommand) -> bool:
         result = await self.repo.delete_trainer(command.details.get("id"))
+        if result:
+            await event_bus.publish(DomainEvent(TRAINER_DELETED, command.details.get("id")))
         return result
@@ -0,0 +1,12 @@
+from cqrs.handlers import ICommandHandler
+from cqrs.trainers.query.read_model import TrainerReadModel, trainer_read_model
+
+
+class RebuildTrainerReadModelCommandHandler(ICommandHandler):
+
+    def __init__(self):
+        self.read_model: TrainerReadModel = trainer_read_model
+
+    async def handle(self) -> int:
+        result = await self.read_model.rebuild()
+        return result
@@ -1,4 +1,5 @@
 from cqrs.commands import ProfileTrainerCommand
+from cqrs.events import DomainEvent, TRAINER_UPDATED, event_bus
 from cqrs.handlers import ICommandHandler
 from repository.gino.trainers import TrainerRepository
 
@@ -9,5 +10,9 @@ class UpdateTrainerCommandHandler(ICommandHandler):
         self.repo: TrainerRepository = TrainerRepository()
 
     async def handle(self, command: ProfileTrainerCommand) -> bool:
-        result = await self.repo.update_trainer(command.details)
+        details = dict(command.details)
+        id = details.pop("id")
+        result = await self.repo.update_trainer(id, details)
+        if result:
+            await event_bus.publish(DomainEvent(TRAINER_UPDATED, id, details))
         return result
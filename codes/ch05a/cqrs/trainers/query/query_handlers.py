@@ -1,25 +1,25 @@
 from cqrs.handlers import IQueryHandler
 from cqrs.queries import ProfileTrainerListQuery, ProfileTrainerRecordQuery
-from repository.gino.trainers import TrainerRepository
+from cqrs.trainers.query.read_model import TrainerReadModel, trainer_read_model
 
 
 class ListTrainerQueryHandler(IQueryHandler):
     def __init__(self):
-        self.repo: TrainerRepository = TrainerRepository()
+        self.read_model: TrainerReadModel = trainer_read_model
         self.query: ProfileTrainerListQuery = ProfileTrainerListQuery()
 
     async def handle(self) -> ProfileTrainerListQuery:
-        data = await self.repo.get_all_member();
+        data = await self.read_model.all()
         self.query.records = data
         return self.query
 
 
 class RecordTrainerQueryHandler(IQueryHandler):
     def __init__(self):
-        self.repo: TrainerRepository = TrainerRepository()
+        self.read_model: TrainerReadModel = trainer_read_model
         self.query: ProfileTrainerRecordQuery = ProfileTrainerRecordQuery()
 
     async def handle(self, id) -> ProfileTrainerListQuery:
-        data = await self.repo.get_member(id);
+        data = await self.read_model.get(id)
         self.query.record = data
         return self.query
@@ -0,0 +1,250 @@
+import asyncio
+import copy
+import json
+import os
+import time
+from typing import Any, Dict, List, Optional
+from uuid import uuid4
+
+from cqrs.events import DomainEvent, TRAINER_DELETED, TRAINER_SAVED, TRAINER_UPDATED, event_bus
+from repository.gino.trainers import GymClassRepository, TrainerRepository
+
+
+class MemoryTrainerStore:
+    """
+    进程内的投影：每个 uvicorn 工作进程各有一份，只能看到本进程处理的写命令，
+    多个工作进程部署时需要设置 READ_MODEL_REDIS_URL 改用 RedisTrainerStore
+    """
+
+    def __init__(self):
+        self._docs: Dict[int, Dict[str, Any]] = dict()
+        self._version = 0
+
+    async def get(self, id: int) -> Optional[Dict[str, Any]]:
+        # 返回副本，调用方修改结果不会改动投影
+        doc = self._docs.get(id)
+        return copy.deepcopy(doc) if doc is not None else None
+
+    async def all(self) -> List[Dict[str, Any]]:
+        # 与 RedisTrainerStore 一致按 id 排序
+        return [copy.deepcopy(self._docs[id]) for id in sorted(self._docs)]
+
+    async def put(self, id: int, doc: Dict[str, Any]):
+        self._docs[id] = doc
+        self._version += 1
+
+    async def delete(self, id: int):
+        self._docs.pop(id, None)
+        self._version += 1
+
+    async def version(self) -> int:
+        return self._version
+
+    async def replace(self, docs: Dict[int, Dict[str, Any]], version: int) -> bool:
+        if self._version != version:
+            return False
+        self._docs = docs
+        self._version += 1
+        return True
+
+
+class RedisTrainerStore:
+    """
+    以 Redis 哈希保存投影，多个工作进程可共享同一份读模型；
+    每次写入同时递增版本键，重建据此判断读库期间是否有其他进程写入了投影
+    """
+
+    def __init__(self, url: str, key: str = "fcms:trainers"):
+        from redis import asyncio as aioredis
+        self._redis = aioredis.from_url(url)
+        self._key = key
+        self._version_key = f"{key}:version"
+
+    async def get(self, id: int) -> Optional[Dict[str, Any]]:
+        raw = await self._redis.hget(self._key, id)
+        return json.loads(raw) if raw is not None else None
+
+    async def all(self) -> List[Dict[str, Any]]:
+        docs = [json.loads(raw) for raw in await self._redis.hvals(self._key)]
+        return sorted(docs, key=lambda doc: doc["id"])
+
+    async def put(self, id: int, doc: Dict[str, Any]):
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.hset(self._key, id, json.dumps(doc, default=str))
+            pipe.incr(self._version_key)
+            await pipe.execute()
+
+    async def delete(self, id: int):
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.hdel(self._key, id)
+            pipe.incr(self._version_key)
+            await pipe.execute()
+
+    async def version(self) -> int:
+        return int(await self._redis.get(self._version_key) or 0)
+
+    async def replace(self, docs: Dict[int, Dict[str, Any]], version: int) -> bool:
+        from redis.exceptions import WatchError
+        # 新投影先写入本次重建独有的临时键，再在监视版本键的事务中 RENAME 覆盖；
+        # 读库之后其他进程投影过事件时版本已变化，事务放弃，不会用旧数据覆盖它们的写入
+        tmp_key = f"{self._key}:rebuild:{uuid4().hex}"
+        if docs:
+            await self._redis.hset(tmp_key, mapping={id: json.dumps(doc, default=str) for id, doc in docs.items()})
+        try:
+            async with self._redis.pipeline(transaction=True) as pipe:
+                await pipe.watch(self._version_key)
+                if int(await pipe.get(self._version_key) or 0) != version:
+                    return False
+                pipe.multi()
+                if docs:
+                    pipe.rename(tmp_key, self._key)
+                else:
+                    pipe.delete(self._key)
+                pipe.incr(self._version_key)
+                await pipe.execute()
+                return True
+        except WatchError:
+            return False
+        finally:
+            await self._redis.delete(tmp_key)
+
+
+class TrainerReadModel:
+    """
+    训练师读模型：命令处理器写库成功后发布领域事件，后台任务按顺序把事件投影为
+    训练师资料连同所带健身课程的非规范化文档，查询处理器只读投影，不再访问 Postgres，
+    健身课程在应用之外维护，变化后通过重建命令从数据库重新生成投影
+    """
+
+    def __init__(self, store):
+        self.store = store
+        self._queue: "asyncio.Queue[DomainEvent]" = None
+        self._consumer: Optional[asyncio.Task] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self.applied = 0
+        self.failed = 0
+        self.dirty = False
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+        self.rebuilt_at: Optional[float] = None
+        self.rebuild_seconds = 0.0
+        for name in (TRAINER_SAVED, TRAINER_UPDATED, TRAINER_DELETED):
+            event_bus.subscribe(name, self.enqueue)
+
+    async def enqueue(self, event: DomainEvent):
+        if self._queue is not None:
+            self._queue.put_nowait(event)
+
+    async def _consume(self):
+        while True:
+            event = await self._queue.get()
+            try:
+                async with self._lock:
+                    await self._apply(event)
+                self.applied += 1
+                self.last_lag = time.monotonic() - event.occurred
+                self.max_lag = max(self.max_lag, self.last_lag)
+            except Exception as e:
+                # 单个事件投影失败不能让后台任务退出，否则之后的事件都不会再被处理；
+                # 投影可能已缺少这次写入，标记为过期并从数据库重建
+                print(e)
+                self.failed += 1
+                self.dirty = True
+                await self._rebuild_quietly()
+            finally:
+                self._queue.task_done()
+
+    async def _rebuild_quietly(self):
+        try:
+            await self.rebuild()
+        except Exception as e:
+            # 重建也失败时保持 dirty，等待下一次重建命令
+            print(e)
+
+    async def _apply(self, event: DomainEvent):
+        if event.name == TRAINER_DELETED:
+            await self.store.delete(event.key)
+            return
+        doc = await self.store.get(event.key)
+        if event.name == TRAINER_UPDATED and doc is None:
+            # 投影中没有该训练师时等下一次重建补齐
+            return
+        doc = dict(doc or {"classes": list()})
+        doc.update(event.data)
+        doc["id"] = event.key
+        await self.store.put(event.key, doc)
+
+    async def rebuild(self, attempts: int = 3) -> int:
+        async with self._lock:
+            start = time.perf_counter()
+            for _ in range(attempts):
+                # 先取版本再读库：读库之后才投影到共享存储的事件必然改变版本，替换会被放弃并重新读库
+                version = await self.store.version()
+                docs = await self._load()
+                if await self.store.replace(docs, version):
+                    break
+            else:
+                self.dirty = True
+                raise RuntimeError(f"trainer read model kept changing during {attempts} rebuild attempts")
+            self.dirty = False
+            self.rebuilt_at = time.time()
+            self.rebuild_seconds = time.perf_counter() - start
+            return len(docs)
+
+    async def _load(self) -> Dict[int, Dict[str, Any]]:
+        docs: Dict[int, Dict[str, Any]] = dict()
+        for trainer in await TrainerRepository().get_all_member():
+            docs[trainer.id] = dict(trainer.to_dict(), classes=list())
+        for gym_class in await GymClassRepository().list_classes():
+            if gym_class.trainer_id in docs:
+                docs[gym_class.trainer_id]["classes"].append(
+                    {"id": gym_class.id, "name": gym_class.name, "member_id": gym_class.member_id,
+                     "approved": gym_class.approved})
+        return docs
+
+    async def all(self) -> List[Dict[str, Any]]:
+        return await self.store.all()
+
+    async def get(self, id: int) -> Optional[Dict[str, Any]]:
+        return await self.store.get(id)
+
+    async def start(self):
+        self._queue = asyncio.Queue()
+        self._lock = asyncio.Lock()
+        await self.rebuild()
+        self._consumer = asyncio.create_task(self._consume())
+
+    async def stop(self, timeout: float = 5.0):
+        if self._consumer is not None:
+            # 最多等待 timeout 秒处理完剩余事件，避免关闭时无限期挂起
+            try:
+                await asyncio.wait_for(self._queue.join(), timeout)
+            except asyncio.TimeoutError:
+                pass
+            self._consumer.cancel()
+            try:
+                await self._consumer
+            except asyncio.CancelledError:
+                pass
+            self._consumer = None
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "pending_events": self._queue.qsize() if self._queue is not None else 0,
+            "applied_events": self.applied,
+            "failed_events": self.failed,
+            "dirty": self.dirty,
+            "last_lag_ms": self.last_lag * 1000,
+            "max_lag_ms": self.max_lag * 1000,
+            "rebuilt_at": self.rebuilt_at,
+            "rebuild_ms": self.rebuild_seconds * 1000,
+        }
+
+
+def build_store():
+    # 未设置 Redis 时读模型只在本进程内，以 --workers 启动多个进程时各进程的投影互不同步
+    redis_url = os.getenv("READ_MODEL_REDIS_URL")
+    return RedisTrainerStore(redis_url) if redis_url else MemoryTrainerStore()
+
+
+trainer_read_model = TrainerReadModel(build_store())
@@ -1,9 +1,23 @@
 from fastapi import FastAPI
 
 from api import admin, members, trainers, login
+from cqrs.trainers.query.read_model import trainer_read_model
+from db_config.gino_connect import bind_db, close_db
 
 app = FastAPI()
 app.include_router(admin.router, prefix='/ch05')
 app.include_router(members.router, prefix='/ch05')
 app.include_router(trainers.router, prefix='/ch05')
 app.include_router(login.router, prefix='/ch05')
+
+
+@app.on_event("startup")
+async def bind_gino():
+    await bind_db()
+    await trainer_read_model.start()
+
+
+@app.on_event("shutdown")
+async def close_gino():
+    await trainer_read_model.stop()
+    await close_db()
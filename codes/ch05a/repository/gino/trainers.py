@@ -41,6 +41,9 @@ class TrainerRepository:
 
 class GymClassRepository:
 
+    async def list_classes(self):
+        return await Gym_Class.query.gino.all()
+
     async def join_classes_trainer(self):
         query = Gym_Class.join(Profile_Trainers).select()
         result = await query.gino.load(Gym_Class.distinct(Gym_Class.id).load(parent=Profile_Trainers)).all()